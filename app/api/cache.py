@@ -0,0 +1,93 @@
+"""
+Response caching for read-only API endpoints.
+
+Cached endpoints store their fully rendered JSON body, so a cache hit
+skips the database, the service layer, and response serialization.
+
+Responses also carry an ETag (a hash of the body) and Cache-Control, so
+clients that revalidate with If-None-Match get an empty 304 instead.
+"""
+import functools
+import hashlib
+import inspect
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from app.config import HTTP_CACHE_MAX_AGE, HTTP_STALE_WHILE_REVALIDATE
+from app.services.cache import get_from_cache, set_to_cache
+
+# Endpoint parameters that don't identify the resource (e.g. the data service)
+_NON_KEY_PARAMS = {"db", "service"}
+
+_CACHE_CONTROL = (
+    f"public, max-age={HTTP_CACHE_MAX_AGE}, "
+    f"stale-while-revalidate={HTTP_STALE_WHILE_REVALIDATE}"
+)
+
+
+def _cache_key(endpoint: str, params: Dict[str, Any]) -> str:
+    """Build a cache key from the endpoint name and its request parameters."""
+    parts = [f"{k}={v}" for k, v in sorted(params.items()) if k not in _NON_KEY_PARAMS]
+    return ":".join(["response", endpoint, *parts])
+
+
+def _render(content: Any) -> bytes:
+    """Serialize endpoint output exactly as ORJSONResponse would."""
+    if isinstance(content, Response):
+        return content.body  # Endpoint already encoded its response
+    return orjson.dumps(jsonable_encoder(content), option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _etag(body: bytes) -> str:
+    """Weak validator derived from the rendered body."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header (which may list several tags) against `etag`."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def cached_response(ttl: int) -> Callable:
+    """
+    Cache an endpoint's rendered JSON response for `ttl` seconds.
+
+    The cache key is (endpoint, path/query params). Errors raised by the
+    endpoint (e.g. HTTPException 404) are not cached. The wrapped endpoint
+    additionally receives the Request, used to answer conditional GETs.
+
+    Usage:
+        @router.get("/summary/{symbol}")
+        @cached_response(ttl=300)
+        async def get_summary(symbol: str, service = Depends(get_data_service)): ...
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(request: Request, **kwargs: Any) -> Response:
+            key = _cache_key(func.__name__, kwargs)
+            cached = get_from_cache(key)
+            if cached is None:
+                body = _render(await func(**kwargs))
+                cached = (body, _etag(body))
+                set_to_cache(key, cached, ttl)
+            body, etag = cached
+            
+            headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+            if _matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
+        
+        # Expose the endpoint's own parameters plus `request` to FastAPI
+        signature = inspect.signature(func)
+        wrapper.__signature__ = signature.replace(parameters=[
+            *signature.parameters.values(),
+            inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request),
+        ])
+        return wrapper
+    return decorator
@@ -3,20 +3,39 @@ FastAPI route definitions.
 
 All endpoints are defined here with proper typing and documentation.
 No business logic - delegates to service layer.
+Read-heavy endpoints cache their rendered response (see app.api.cache).
 
 Error Handling:
 - 404: Symbol not found
 - 422: Invalid request parameters
 - 503: Data source unavailable
 """
+import bisect
+import math
 from datetime import date
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-
+from typing import Any, List, Optional, Type, TypeVar
+
+import numpy as np
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.cache import cached_response
+from app.config import (
+    RESPONSE_TTL_COMPANIES,
+    RESPONSE_TTL_SUMMARY,
+    RESPONSE_TTL_TOP_MOVERS,
+    RESPONSE_TTL_ANALYTICS,
+    RESPONSE_TTL_SENTIMENT,
+    RESPONSE_TTL_DATA,
+    RESPONSE_TTL_COMPARE,
+    RESPONSE_TTL_PREDICTION,
+    TOP_MOVERS_MAX_LIMIT,
+)
 from app.db.database import get_db
 from app.services.data_service import DataService
+from app.services.prediction import PredictionService, SentimentService
 from app.schemas.stock import (
     CompanyResponse,
     DailyPriceResponse,
@@ -27,8 +46,53 @@ from app.schemas.stock import (
     MoverStock,
 )
 
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
 router = APIRouter()
 
+# Label lookup tables for /analytics: bisect_left counts the thresholds
+# strictly below x, so labels[i] covers bins[i-1] < x <= bins[i]. The
+# "x < low" boundaries are stored as the float just below the threshold,
+# which makes x == low land in the upper label (rsi 30 is bearish,
+# volatility 0.2 is normal), as with the original comparisons.
+_RSI_BINS = (math.nextafter(30, -math.inf), 50, 70)
+_RSI_LABELS = ("oversold", "bearish", "bullish", "overbought")
+_VOL_BINS = (math.nextafter(0.2, -math.inf), 0.4)
+_VOL_LABELS = ("low", "normal", "high")
+
+# Field order of each /data row
+_DAILY_PRICE_FIELDS = tuple(DailyPriceResponse.model_fields)
+
+
+def _rsi_trend(rsi: float) -> str:
+    """RSI label: oversold (< 30), bearish (<= 50), bullish (<= 70) or overbought."""
+    return _RSI_LABELS[bisect.bisect_left(_RSI_BINS, rsi)]
+
+
+def _volatility_level(volatility: float) -> str:
+    """Annualized volatility label: low (< 0.2), normal (<= 0.4) or high."""
+    return _VOL_LABELS[bisect.bisect_left(_VOL_BINS, volatility)]
+
+
+def _construct(model: Type[_ModelT], row: Any) -> _ModelT:
+    """
+    Build a response model from a trusted DB row without validation.
+    
+    Rows come straight from our own schema, so model_construct skips the
+    Pydantic validator pipeline that model_validate would run.
+    """
+    return model.model_construct(**{name: getattr(row, name) for name in model.model_fields})
+
+
+async def get_data_service(db: AsyncSession = Depends(get_db)) -> DataService:
+    """
+    Dependency providing a request-scoped DataService.
+    
+    Bound to the request's DB session; symbol lookups within the request
+    resolve through the shared company map (one query per cache period).
+    """
+    return DataService(db)
+
 
 # === Company Endpoints ===
 
@@ -38,11 +102,11 @@ router = APIRouter()
     summary="List all companies",
     description="Returns all tracked companies with symbol, name, and sector.",
 )
-def get_companies(db: Session = Depends(get_db)) -> List[CompanyResponse]:
+@cached_response(ttl=RESPONSE_TTL_COMPANIES)
+async def get_companies(service: DataService = Depends(get_data_service)) -> List[CompanyResponse]:
     """List all available companies in the database."""
-    service = DataService(db)
-    companies = service.get_all_companies()
-    return [CompanyResponse.model_validate(c) for c in companies]
+    companies = await service.get_all_companies()
+    return [_construct(CompanyResponse, c) for c in companies]
 
 
 # === Price Data Endpoints ===
@@ -56,31 +120,32 @@ def get_companies(db: Session = Depends(get_db)) -> List[CompanyResponse]:
         404: {"description": "Symbol not found"},
     },
 )
-def get_stock_data(
+@cached_response(ttl=RESPONSE_TTL_DATA)
+async def get_stock_data(
     symbol: str,
     days: int = Query(default=30, ge=1, le=365, description="Number of days"),
-    db: Session = Depends(get_db),
-) -> List[DailyPriceResponse]:
+    service: DataService = Depends(get_data_service),
+) -> Response:
     """
     Get last N days of stock data for a symbol.
     
     Includes computed analytics: daily_return, ma_7, ma_20, volatility_20d, rsi_14
     """
-    service = DataService(db)
-    
-    # Validate symbol exists
-    if not service.symbol_exists(symbol):
+    # Unknown symbols come back as an empty result (single query)
+    prices = await service.get_recent_prices(symbol, days)
+    if not prices:
         raise HTTPException(
             status_code=404,
             detail=f"Symbol '{symbol}' not found in database"
         )
     
-    prices = service.get_recent_prices(symbol, days)
-    
-    # Sort ascending for client (API returns most recent first by default)
-    prices = sorted(prices, key=lambda p: p.date)
-    
-    return [DailyPriceResponse.model_validate(p) for p in prices]
+    # Largest payload in the API: encode the rows directly, skipping the
+    # per-object model layer (response_model still documents the schema)
+    body = orjson.dumps(
+        [{name: getattr(p, name) for name in _DAILY_PRICE_FIELDS} for p in prices],
+        option=orjson.OPT_SERIALIZE_NUMPY,
+    )
+    return Response(content=body, media_type="application/json")
 
 
 # === Summary Endpoints ===
@@ -94,15 +159,14 @@ def get_stock_data(
         404: {"description": "Symbol not found"},
     },
 )
-def get_summary(
+@cached_response(ttl=RESPONSE_TTL_SUMMARY)
+async def get_summary(
     symbol: str,
-    db: Session = Depends(get_db),
+    service: DataService = Depends(get_data_service),
 ) -> SummaryResponse:
     """Get 52-week summary statistics for a stock."""
-    service = DataService(db)
-    
     # Get company info
-    company = service.get_company_by_symbol(symbol)
+    company = await service.get_company_by_symbol(symbol)
     if not company:
         raise HTTPException(
             status_code=404,
@@ -110,7 +174,7 @@ def get_summary(
         )
     
     # Get summary stats
-    summary = service.get_52_week_summary(symbol)
+    summary = await service.get_52_week_summary(symbol)
     if not summary:
         raise HTTPException(
             status_code=404,
@@ -136,10 +200,11 @@ def get_summary(
         422: {"description": "Invalid parameters"},
     },
 )
-def compare_stocks(
+@cached_response(ttl=RESPONSE_TTL_COMPARE)
+async def compare_stocks(
     symbol1: str = Query(..., description="First stock symbol"),
     symbol2: str = Query(..., description="Second stock symbol"),
-    db: Session = Depends(get_db),
+    service: DataService = Depends(get_data_service),
 ) -> CompareResponse:
     """
     Compare two stocks.
@@ -152,11 +217,10 @@ def compare_stocks(
             detail="symbol1 and symbol2 must be different"
         )
     
-    service = DataService(db)
-    
-    # Validate both symbols exist
-    company1 = service.get_company_by_symbol(symbol1)
-    company2 = service.get_company_by_symbol(symbol2)
+    # Validate both symbols exist (single lookup for both)
+    companies = await service.get_companies_by_symbols([symbol1, symbol2])
+    company1 = companies.get(symbol1)
+    company2 = companies.get(symbol2)
     
     if not company1:
         raise HTTPException(
@@ -170,7 +234,7 @@ def compare_stocks(
         )
     
     # Get comparison data
-    summary1, summary2, correlation = service.get_comparison_data(symbol1, symbol2)
+    summary1, summary2, correlation = await service.get_comparison_data(symbol1, symbol2)
     
     if not summary1 or not summary2:
         raise HTTPException(
@@ -215,21 +279,20 @@ def compare_stocks(
     summary="Get top gainers and losers",
     description="Returns top 5 gainers and losers based on daily return.",
 )
-def get_top_movers(
-    limit: int = Query(default=5, ge=1, le=20, description="Number of stocks per category"),
-    db: Session = Depends(get_db),
+@cached_response(ttl=RESPONSE_TTL_TOP_MOVERS)
+async def get_top_movers(
+    limit: int = Query(default=5, ge=1, le=TOP_MOVERS_MAX_LIMIT, description="Number of stocks per category"),
+    service: DataService = Depends(get_data_service),
 ) -> TopMoversResponse:
     """Get today's top gainers and losers."""
-    service = DataService(db)
-    
-    latest_date = service.get_latest_trading_date()
+    latest_date = await service.get_latest_trading_date()
     if not latest_date:
         raise HTTPException(
             status_code=503,
             detail="No trading data available"
         )
     
-    gainers, losers = service.get_top_movers(limit)
+    gainers, losers = await service.get_top_movers(limit)
     
     return TopMoversResponse(
         date=latest_date,
@@ -248,45 +311,27 @@ def get_top_movers(
         404: {"description": "Symbol not found"},
     },
 )
-def get_analytics(
+@cached_response(ttl=RESPONSE_TTL_ANALYTICS)
+async def get_analytics(
     symbol: str,
-    db: Session = Depends(get_db),
+    service: DataService = Depends(get_data_service),
 ) -> dict:
     """Get detailed analytics for a stock."""
-    service = DataService(db)
-    
-    if not service.symbol_exists(symbol):
-        raise HTTPException(
-            status_code=404,
-            detail=f"Symbol '{symbol}' not found in database"
-        )
-    
-    latest = service.get_latest_price(symbol)
+    latest = await service.get_latest_price(symbol)
     if not latest:
         raise HTTPException(
             status_code=404,
-            detail=f"No price data for symbol '{symbol}'"
+            detail=f"Symbol '{symbol}' not found in database"
         )
     
-    # Determine trend from RSI
+    # Classify RSI and volatility with a single bisect into the bin tables
     trend = "neutral"
     if latest.rsi_14:
-        if latest.rsi_14 > 70:
-            trend = "overbought"
-        elif latest.rsi_14 < 30:
-            trend = "oversold"
-        elif latest.rsi_14 > 50:
-            trend = "bullish"
-        else:
-            trend = "bearish"
+        trend = _rsi_trend(latest.rsi_14)
     
-    # Determine volatility level
     vol_level = "normal"
     if latest.volatility_20d:
-        if latest.volatility_20d > 0.4:
-            vol_level = "high"
-        elif latest.volatility_20d < 0.2:
-            vol_level = "low"
+        vol_level = _volatility_level(latest.volatility_20d)
     
     return {
         "symbol": symbol,
@@ -314,9 +359,10 @@ def get_analytics(
         404: {"description": "Symbol not found"},
     },
 )
-def get_prediction(
+@cached_response(ttl=RESPONSE_TTL_PREDICTION)
+async def get_prediction(
     symbol: str,
-    db: Session = Depends(get_db),
+    service: DataService = Depends(get_data_service),
 ) -> dict:
     """
     Generate 7-day price forecast using Linear Regression.
@@ -324,41 +370,28 @@ def get_prediction(
     Uses the last 60 days of data to train a simple model.
     Returns predicted prices, trend direction, and confidence score.
     """
-    from app.services.prediction import PredictionService
-    
-    service = DataService(db)
-    
-    if not service.symbol_exists(symbol):
+    # Get historical closes for prediction (empty for unknown symbols)
+    prices = await service.get_recent_closes(symbol, days=90)
+    if not prices:
         raise HTTPException(
             status_code=404,
             detail=f"Symbol '{symbol}' not found in database"
         )
     
-    # Get historical prices for prediction
-    prices = service.get_recent_prices(symbol, days=90)
-    
     if len(prices) < 30:
         raise HTTPException(
             status_code=422,
             detail=f"Insufficient data for prediction (need at least 30 days)"
         )
     
-    # Sort by date ascending
-    prices = sorted(prices, key=lambda p: p.date)
-    
     try:
-        # Extract close prices and dates
-        close_prices = [p.close for p in prices]
-        # Handle both datetime.date objects and string dates
-        dates = []
-        for p in prices:
-            if hasattr(p.date, 'strftime'):
-                dates.append(p.date.strftime("%Y-%m-%d"))
-            else:
-                dates.append(str(p.date)[:10])  # Ensure YYYY-MM-DD format
+        # Extract close prices straight into a float64 array
+        close_prices = np.fromiter(
+            (p.close for p in prices), dtype=np.float64, count=len(prices)
+        )
         
-        # Generate predictions
-        prediction_result = PredictionService.predict_prices(close_prices, dates)
+        # Generate predictions (only the last date is needed for the forecast)
+        prediction_result = PredictionService.predict_prices(close_prices, prices[-1].date)
         
         if "error" in prediction_result:
             raise HTTPException(
@@ -387,9 +420,10 @@ def get_prediction(
         404: {"description": "Symbol not found"},
     },
 )
-def get_sentiment(
+@cached_response(ttl=RESPONSE_TTL_SENTIMENT)
+async def get_sentiment(
     symbol: str,
-    db: Session = Depends(get_db),
+    service: DataService = Depends(get_data_service),
 ) -> dict:
     """
     Calculate mock sentiment index (0-100).
@@ -400,26 +434,16 @@ def get_sentiment(
     - Price vs Moving Averages (20%)
     - Recent trend (20%)
     """
-    from app.services.prediction import SentimentService
-    
-    service = DataService(db)
-    
-    if not service.symbol_exists(symbol):
-        raise HTTPException(
-            status_code=404,
-            detail=f"Symbol '{symbol}' not found in database"
-        )
-    
-    # Get latest price data
-    latest = service.get_latest_price(symbol)
+    # Get latest price data (empty for unknown symbols)
+    latest = await service.get_latest_price(symbol)
     if not latest:
         raise HTTPException(
             status_code=404,
-            detail=f"No price data for symbol '{symbol}'"
+            detail=f"Symbol '{symbol}' not found in database"
         )
     
     # Get 52-week summary for price change %
-    summary = service.get_52_week_summary(symbol)
+    summary = await service.get_52_week_summary(symbol)
     price_change_pct = summary.get("change_52w_pct") if summary else None
     
     try:
@@ -452,13 +476,11 @@ def get_sentiment(
     summary="Health check",
     description="Returns API health status and database connectivity.",
 )
-def health_check(db: Session = Depends(get_db)) -> dict:
+async def health_check(service: DataService = Depends(get_data_service)) -> dict:
     """API health check endpoint."""
-    service = DataService(db)
-    
     try:
-        companies = len(service.get_all_companies())
-        latest_date = service.get_latest_trading_date()
+        companies = len(await service.get_all_companies())
+        latest_date = await service.get_latest_trading_date()
         
         return {
             "status": "healthy",
@@ -17,6 +17,26 @@ DATA_DIR.mkdir(exist_ok=True)
 
 # === Database ===
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DATABASE_PATH}"  # Used by the API
+
+# Connection pool sizing (per engine). Size to roughly workers * concurrent
+# requests so bursts queue briefly instead of failing with QueuePool timeouts.
+DB_POOL_SIZE = 25
+DB_MAX_OVERFLOW = 25
+DB_POOL_TIMEOUT_SECONDS = 10
+DB_POOL_RECYCLE_SECONDS = 1800
+
+# SQLite PRAGMAs applied to every new connection. The workload is read-heavy
+# and append-only: WAL lets readers proceed while ingestion writes, and a
+# large page cache + mmap keep hot index pages in memory.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",       # Safe with WAL; fsync only at checkpoints
+    "cache_size": -131072,         # Negative = KiB, i.e. 128 MB page cache
+    "mmap_size": 1073741824,       # 1 GB memory-mapped I/O
+    "temp_store": "MEMORY",
+    "foreign_keys": "ON",
+}
 
 # === Stock Configuration ===
 # 12 major Indian NSE stocks for optimal speed/coverage balance
@@ -43,6 +63,18 @@ HISTORY_PERIOD = "2y"
 MAX_RETRIES = 3
 RETRY_BACKOFF_SECONDS = 2.0
 
+# Max concurrent per-symbol fetches when retrying outside the bulk download
+FETCH_CONCURRENCY = 8
+
+# On-disk HTTP cache for yfinance requests (SQLite backend; requests-cache
+# appends the .sqlite suffix). Re-runs within the expiry window are served
+# locally, and stale entries are reused if Yahoo errors out.
+YF_CACHE_PATH = DATA_DIR / "yf_cache"
+YF_CACHE_EXPIRE_SECONDS = 3600
+
+# Keep-alive connections held open to Yahoo (>= FETCH_CONCURRENCY)
+YF_HTTP_POOL_SIZE = 16
+
 # === Analytics Parameters ===
 # Rolling window sizes (in trading days)
 MA_WINDOW_7 = 7
@@ -67,3 +99,23 @@ API_VERSION = "1.0.0"
 # Default query limits
 DEFAULT_DAYS = 30
 MAX_DAYS = 365
+TOP_MOVERS_MAX_LIMIT = 20  # Also the number of movers materialized per side
+
+# === Caching ===
+# Market data changes once per trading day, so short TTLs are safe.
+CACHE_TTL_SECONDS = 300  # Service-level query cache (5 minutes)
+CACHE_MAX_ENTRIES = 4096  # LRU bound across service and response entries
+
+# Rendered API response cache TTLs (seconds)
+RESPONSE_TTL_COMPANIES = 3600
+RESPONSE_TTL_SUMMARY = 300
+RESPONSE_TTL_TOP_MOVERS = 60
+RESPONSE_TTL_ANALYTICS = 300
+RESPONSE_TTL_SENTIMENT = 300
+RESPONSE_TTL_DATA = 300
+RESPONSE_TTL_COMPARE = 300
+RESPONSE_TTL_PREDICTION = 300
+
+# HTTP caching headers sent with cached responses (clients revalidate via ETag)
+HTTP_CACHE_MAX_AGE = 60
+HTTP_STALE_WHILE_REVALIDATE = 300
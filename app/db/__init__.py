@@ -1,5 +1,16 @@
 # Database package
-from app.db.database import engine, get_db, SessionLocal
-from app.db.models import Base, Company, DailyPrice
+from app.db.database import engine, async_engine, get_db, SessionLocal, AsyncSessionLocal
+from app.db.models import Base, Company, DailyPrice, TopMover, LatestSnapshot
 
-__all__ = ["engine", "get_db", "SessionLocal", "Base", "Company", "DailyPrice"]
+__all__ = [
+    "engine",
+    "async_engine",
+    "get_db",
+    "SessionLocal",
+    "AsyncSessionLocal",
+    "Base",
+    "Company",
+    "DailyPrice",
+    "TopMover",
+    "LatestSnapshot",
+]
@@ -2,44 +2,174 @@
 Database connection and session management.
 
 SQLite is used as the default database with proper session lifecycle handling.
+
+Two engines share the same database file:
+- async_engine / AsyncSessionLocal: used by the API so that DB-bound requests
+  await I/O instead of occupying a threadpool worker.
+- engine / SessionLocal: synchronous access for scripts (data ingestion)
+  and schema management.
 """
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from typing import AsyncGenerator
 
-from app.config import DATABASE_URL
+from app.config import (
+    DATABASE_URL,
+    ASYNC_DATABASE_URL,
+    DB_POOL_SIZE,
+    DB_MAX_OVERFLOW,
+    DB_POOL_TIMEOUT_SECONDS,
+    DB_POOL_RECYCLE_SECONDS,
+    SQLITE_PRAGMAS,
+)
+
+# Explicit pool settings shared by both engines (SQLAlchemy defaults to 5 + 10)
+_POOL_OPTIONS = dict(
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=True,
+)
 
 # Create engine with SQLite-specific optimizations
 engine = create_engine(
     DATABASE_URL,
     connect_args={"check_same_thread": False},  # Required for SQLite with FastAPI
     echo=False,  # Set True for SQL debugging
+    **_POOL_OPTIONS,
 )
 
-# Session factory
+# Async engine for the API (aiosqlite driver). The aiosqlite dialect
+# defaults to NullPool for file databases on SQLAlchemy < 2.1, which rejects
+# the sizing options, so the queue pool is selected explicitly
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=False,
+    poolclass=AsyncAdaptedQueuePool,
+    **_POOL_OPTIONS,
+)
+
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Apply SQLITE_PRAGMAS to each new DB-API connection."""
+    cursor = dbapi_connection.cursor()
+    for name, value in SQLITE_PRAGMAS.items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+# Both the API and ingestion connections get the same tuning: WAL lets
+# ingestion commits avoid rollback-journal fsyncs while the API keeps reading
+event.listen(engine, "connect", _apply_sqlite_pragmas)
+event.listen(async_engine.sync_engine, "connect", _apply_sqlite_pragmas)
+
+# Session factories
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Dependency injection for database sessions.
-    
-    Yields a database session and ensures proper cleanup after request.
+
+    Yields an async database session and ensures proper cleanup after request.
     Use with FastAPI's Depends().
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+def _migrate_indexes(conn) -> None:
+    """Bring the indexes of tables created by earlier versions in line with the models."""
+    from app.db.models import Base
+    
+    # create_all skips tables that already exist, so also add any indexes
+    # introduced after the table was first created, rebuilding those whose
+    # column list has changed since
+    inspector = inspect(conn)
+    for table in Base.metadata.sorted_tables:
+        existing = {i["name"]: i["column_names"] for i in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing and existing[index.name] != [c.name for c in index.columns]:
+                index.drop(bind=conn)
+            index.create(bind=conn, checkfirst=True)
+    
+    # Retired: duplicated the leading columns of uq_symbol_date
+    conn.execute(text("DROP INDEX IF EXISTS ix_daily_prices_symbol_date"))
+    
+    # The price upsert relies on ON CONFLICT(symbol, date), which needs a
+    # unique index on those columns. uq_symbol_date provides it for tables
+    # created from the current model; add one to older tables that lack it
+    inspector = inspect(conn)
+    unique_keys = [c["column_names"] for c in inspector.get_unique_constraints("daily_prices")]
+    unique_keys += [i["column_names"] for i in inspector.get_indexes("daily_prices") if i["unique"]]
+    if ["symbol", "date"] not in unique_keys:
+        conn.execute(text(
+            "CREATE UNIQUE INDEX uq_daily_prices_symbol_date ON daily_prices (symbol, date)"
+        ))
+
+
+def _epoch_dates(conn, table: str) -> None:
+    """Convert table.date from ISO-8601 TEXT to EpochDate day numbers."""
+    conn.execute(text(
+        f"UPDATE {table} "
+        "SET date = CAST(julianday(date) - julianday('1970-01-01') AS INTEGER) "
+        "WHERE typeof(date) = 'text'"
+    ))
+
+
+def _migrate_price_dates(conn) -> None:
+    """Convert daily_prices.date to EpochDate day numbers."""
+    _epoch_dates(conn, "daily_prices")
+
+
+def _migrate_materialized_dates(conn) -> None:
+    """Convert top_movers.date and symbols_latest.date to EpochDate day numbers."""
+    _epoch_dates(conn, "top_movers")
+    _epoch_dates(conn, "symbols_latest")
+
+
+def _backfill_daily_return(conn) -> None:
+    """Set daily_return to 0 where earlier versions stored NULL (NaN from a zero open)."""
+    conn.execute(text("UPDATE daily_prices SET daily_return = 0 WHERE daily_return IS NULL"))
+
+
+# One-time migrations for databases written by earlier versions, in order.
+# PRAGMA user_version records how many have been applied, so each step runs
+# once per database rather than on every startup. Append new steps; never
+# reorder or remove them. Each step is idempotent, so a worker that raced
+# another through the check only repeats no-ops
+_MIGRATIONS = (
+    _migrate_indexes,
+    _migrate_price_dates,
+    _migrate_materialized_dates,
+    _backfill_daily_return,
+)
 
 
 def init_db() -> None:
     """
     Initialize database tables.
-    
-    Creates all tables defined in models if they don't exist.
-    Safe to call multiple times.
+
+    Creates all tables defined in models if they don't exist, then applies
+    any migrations the database has not seen yet (tracked in PRAGMA
+    user_version). Safe to call multiple times.
     """
     from app.db.models import Base
     Base.metadata.create_all(bind=engine)
+    
+    with engine.begin() as conn:
+        applied = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        if applied >= len(_MIGRATIONS):
+            return
+        for migrate in _MIGRATIONS[applied:]:
+            migrate(conn)
+        conn.exec_driver_sql(f"PRAGMA user_version = {len(_MIGRATIONS)}")
@@ -4,22 +4,54 @@ SQLAlchemy ORM models for stock data.
 Database Schema:
 - companies: Master list of tracked stocks
 - daily_prices: OHLCV data with pre-computed analytics
+- top_movers: Gainers/losers materialized at ingestion for the latest date
+- symbols_latest: Per-symbol latest analytics + 52-week stats, materialized at ingestion
 
 Design Decisions:
 1. Derived metrics (daily_return, ma_7, volatility, rsi) stored at ingestion time
    to avoid recomputation on every API call.
-2. Composite index on (symbol, date) for efficient time-series queries.
+2. Unique (symbol, date) index for efficient time-series queries,
+   plus covering indexes for the top-movers and close-only read paths.
 3. No cascade deletes - data integrity is critical in financial systems.
+4. Dates are stored as INTEGER days since the Unix epoch (EpochDate),
+   so index lookups compare integers instead of TEXT.
 """
 from datetime import datetime, date
+from typing import Optional
 from sqlalchemy import (
-    Column, Integer, String, Float, BigInteger, Date, DateTime,
+    Column, Integer, String, Float, BigInteger, DateTime,
     Index, UniqueConstraint
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.types import TypeDecorator
 
 Base = declarative_base()
 
+# date.toordinal() of 1970-01-01
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+class EpochDate(TypeDecorator):
+    """
+    Calendar date stored as an INTEGER count of days since 1970-01-01.
+    
+    Python code keeps working with datetime.date; the database compares
+    and indexes plain integers instead of ISO-8601 TEXT. The value is also
+    a numpy datetime64[D], so it can be read into arrays without parsing.
+    """
+    impl = Integer
+    cache_ok = True
+    
+    def process_bind_param(self, value: Optional[date], dialect) -> Optional[int]:
+        if value is None:
+            return None
+        return value.toordinal() - _EPOCH_ORDINAL
+    
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[date]:
+        if value is None:
+            return None
+        return date.fromordinal(value + _EPOCH_ORDINAL)
+
 
 class Company(Base):
     """
@@ -57,7 +89,7 @@ class DailyPrice(Base):
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     symbol = Column(String(20), nullable=False, index=True)
-    date = Column(Date, nullable=False, index=True)
+    date = Column(EpochDate, nullable=False, index=True)
     
     # OHLCV fields
     open = Column(Float, nullable=False)
@@ -66,8 +98,9 @@ class DailyPrice(Base):
     close = Column(Float, nullable=False)
     volume = Column(BigInteger, nullable=True)
     
-    # Pre-computed analytics (nullable for initial rolling window days)
-    daily_return = Column(Float, nullable=True)
+    # Pre-computed analytics. daily_return is defined for every row; the
+    # rolling metrics are nullable for the initial window days
+    daily_return = Column(Float, nullable=False, default=0.0, server_default="0")
     ma_7 = Column(Float, nullable=True)
     ma_20 = Column(Float, nullable=True)
     volatility_20d = Column(Float, nullable=True)
@@ -75,11 +108,72 @@ class DailyPrice(Base):
     
     created_at = Column(DateTime, default=datetime.utcnow)
     
-    # Composite index for time-series queries: WHERE symbol = ? ORDER BY date
+    # uq_symbol_date doubles as the composite index for time-series queries
+    # (WHERE symbol = ? ORDER BY date).
+    # Covering indexes (SQLite has no INCLUDE, so extra columns are appended):
+    # - (date, daily_return, symbol, close): top movers,
+    #   WHERE date = ? ORDER BY daily_return, read from the index alone
+    # - (symbol, date, close): close-only reads (prediction, correlation)
     __table_args__ = (
-        Index("ix_daily_prices_symbol_date", "symbol", "date"),
+        Index("ix_daily_prices_date_return", "date", "daily_return", "symbol", "close"),
+        Index("ix_daily_prices_symbol_date_close", "symbol", "date", "close"),
         UniqueConstraint("symbol", "date", name="uq_symbol_date"),
     )
     
     def __repr__(self) -> str:
         return f"<DailyPrice(symbol='{self.symbol}', date='{self.date}', close={self.close})>"
+
+
+class TopMover(Base):
+    """
+    Top gainers and losers for a trading date, materialized at ingestion.
+    
+    The ranking only changes when new daily data arrives, so it is computed
+    once per ingestion run instead of sorting daily_prices on every request.
+    
+    kind is "gainer" (rank 1 = best daily return) or "loser"
+    (rank 1 = worst daily return).
+    """
+    __tablename__ = "top_movers"
+    
+    date = Column(EpochDate, primary_key=True)
+    kind = Column(String(10), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    symbol = Column(String(20), nullable=False)
+    name = Column(String(100), nullable=False)
+    close = Column(Float, nullable=False)
+    change_pct = Column(Float, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<TopMover(date='{self.date}', kind='{self.kind}', rank={self.rank}, symbol='{self.symbol}')>"
+
+
+class LatestSnapshot(Base):
+    """
+    Latest analytics row and 52-week statistics per symbol, materialized at ingestion.
+    
+    Lets /analytics, /summary and /sentiment read one row by primary key
+    instead of sorting and aggregating daily_prices per request. Values are
+    stored unrounded; the API rounds them exactly as the live path does.
+    """
+    __tablename__ = "symbols_latest"
+    
+    symbol = Column(String(20), primary_key=True)
+    date = Column(EpochDate, nullable=False)
+    
+    # Most recent daily_prices row
+    close = Column(Float, nullable=False)
+    daily_return = Column(Float, nullable=False)
+    ma_7 = Column(Float, nullable=True)
+    ma_20 = Column(Float, nullable=True)
+    volatility_20d = Column(Float, nullable=True)
+    rsi_14 = Column(Float, nullable=True)
+    
+    # 52-week (WEEK_52_WINDOW trading days) statistics
+    high_52w = Column(Float, nullable=False)
+    low_52w = Column(Float, nullable=False)
+    avg_close_52w = Column(Float, nullable=False)
+    change_52w_pct = Column(Float, nullable=False)
+    
+    def __repr__(self) -> str:
+        return f"<LatestSnapshot(symbol='{self.symbol}', date='{self.date}', close={self.close})>"
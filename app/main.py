@@ -8,13 +8,24 @@ Demonstrates:
 - Proper error handling with meaningful responses
 - Comprehensive Swagger documentation
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import API_TITLE, API_DESCRIPTION, API_VERSION
 from app.api.routes import router
 from app.db.database import init_db
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create any missing tables (e.g. top_movers) before serving requests."""
+    init_db()
+    yield
+
+
 # Initialize FastAPI application
 app = FastAPI(
     title=API_TITLE,
@@ -23,6 +34,8 @@ app = FastAPI(
     docs_url="/docs",      # Swagger UI
     redoc_url="/redoc",    # ReDoc alternative
     openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,  # orjson: faster JSON encoding
+    lifespan=lifespan,
 )
 
 # CORS middleware for frontend access
@@ -5,15 +5,23 @@ All financial metric computations are centralized here.
 No analytics logic should exist in API routes.
 
 Design Principles:
-1. Vectorized Pandas operations (O(n) complexity)
+1. Single-pass O(n) computation (Numba kernels in analytics_kernels)
 2. No look-ahead bias - rolling windows use only historical data
 3. Deterministic: same input → same output
 """
+import functools
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from typing import Optional
 import math
 
+from app.services.analytics_kernels import (
+    compute_all,
+    compute_all_grouped,
+    rolling_mean,
+    wilder_ema,
+)
 from app.config import (
     MA_WINDOW_7,
     MA_WINDOW_20,
@@ -23,11 +31,47 @@ from app.config import (
 )
 
 
+def _aligned_correlation(
+    dates1: np.ndarray,
+    values1: np.ndarray,
+    dates2: np.ndarray,
+    values2: np.ndarray,
+) -> Optional[float]:
+    """Pearson correlation over the common dates of two series."""
+    _, idx1, idx2 = np.intersect1d(dates1, dates2, assume_unique=True, return_indices=True)
+    
+    if len(idx1) < 30:  # Need sufficient data for meaningful correlation
+        return None
+    
+    corr = np.corrcoef(values1[idx1], values2[idx2])[0, 1]
+    
+    return float(corr) if not np.isnan(corr) else None
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_aligned_correlation(
+    dates1_dtype: str,
+    dates1: bytes,
+    values1: bytes,
+    dates2_dtype: str,
+    dates2: bytes,
+    values2: bytes,
+) -> Optional[float]:
+    """_aligned_correlation keyed on the raw array bytes (Memoized)."""
+    return _aligned_correlation(
+        np.frombuffer(dates1, dtype=dates1_dtype),
+        np.frombuffer(values1, dtype=np.float64),
+        np.frombuffer(dates2, dtype=dates2_dtype),
+        np.frombuffer(values2, dtype=np.float64),
+    )
+
+
 class AnalyticsService:
     """
     Financial analytics computation engine.
     
-    All methods operate on Pandas DataFrames for efficient vectorized computation.
+    Methods accept and return Pandas objects; rolling metrics delegate the
+    per-element work to compiled kernels over the underlying NumPy arrays.
     """
     
     @staticmethod
@@ -35,12 +79,16 @@ class AnalyticsService:
         """
         Calculate intraday return.
         
-        Formula: (close - open) / open
+        Formula: (close - open) / open, defined as 0 when open is 0
         
         Returns:
             Series of daily returns (as decimals, not percentages)
         """
-        return (df["close"] - df["open"]) / df["open"]
+        open_ = df["open"].to_numpy(dtype=np.float64)
+        close = df["close"].to_numpy(dtype=np.float64)
+        out = np.zeros_like(open_)
+        np.divide(close - open_, open_, out=out, where=open_ != 0)
+        return pd.Series(out, index=df.index)
     
     @staticmethod
     def compute_moving_average(series: pd.Series, window: int) -> pd.Series:
@@ -54,7 +102,8 @@ class AnalyticsService:
         Returns:
             Series with SMA values (NaN for initial periods)
         """
-        return series.rolling(window=window, min_periods=window).mean()
+        values = rolling_mean(series.to_numpy(dtype=np.float64), window)
+        return pd.Series(values, index=series.index)
     
     @staticmethod
     def compute_volatility(daily_returns: pd.Series, window: int = VOLATILITY_WINDOW) -> pd.Series:
@@ -73,9 +122,13 @@ class AnalyticsService:
         Returns:
             Series of annualized volatility scores
         """
-        rolling_std = daily_returns.rolling(window=window, min_periods=window).std()
-        annualized = rolling_std * math.sqrt(252)
-        return annualized
+        arr = daily_returns.to_numpy(dtype=np.float64)
+        out = np.full(len(arr), np.nan)
+        if len(arr) >= window:
+            # (n - window + 1, window) zero-copy view, one row per window
+            windows = sliding_window_view(arr, window)
+            out[window - 1:] = windows.std(axis=1, ddof=1) * math.sqrt(252)
+        return pd.Series(out, index=daily_returns.index)
     
     @staticmethod
     def compute_rsi(series: pd.Series, window: int = RSI_WINDOW) -> pd.Series:
@@ -100,24 +153,27 @@ class AnalyticsService:
         Returns:
             Series of RSI values (0-100 scale)
         """
-        # Calculate price changes
-        delta = series.diff()
+        # Calculate price changes (leading NaN, as with Series.diff)
+        delta = series.diff().to_numpy(dtype=np.float64)
         
-        # Separate gains and losses
-        gains = delta.clip(lower=0)
-        losses = (-delta).clip(lower=0)
+        # Separate gains and losses (np.maximum propagates the leading NaN)
+        gains = np.maximum(delta, 0.0)
+        losses = np.maximum(-delta, 0.0)
         
-        # Calculate average gains and losses using exponential moving average
-        # This is the Wilder smoothing method (standard for RSI)
-        avg_gain = gains.ewm(alpha=1/window, min_periods=window, adjust=False).mean()
-        avg_loss = losses.ewm(alpha=1/window, min_periods=window, adjust=False).mean()
+        # Calculate average gains and losses using Wilder smoothing
+        # (EMA with alpha = 1/window, seeded with the first window's mean)
+        avg_gain = wilder_ema(gains, window)
+        avg_loss = wilder_ema(losses, window)
         
-        # Calculate RS and RSI
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        # Handle edge case: if avg_loss is 0, RS is infinite → RSI = 100
-        rsi = rsi.replace([np.inf, -np.inf], np.nan)
+        # Calculate RS and RSI. Where avg_loss is 0, RS is infinite (RSI = 100)
+        # unless there were no gains either (flat prices: RSI undefined)
+        rs = np.divide(
+            avg_gain,
+            avg_loss,
+            out=np.where(avg_gain > 0, np.inf, np.nan),
+            where=avg_loss > 0,
+        )
+        rsi = pd.Series(100 - (100 / (1 + rs)), index=series.index)
         
         return rsi
     
@@ -132,13 +188,13 @@ class AnalyticsService:
         Returns:
             Dictionary with high_52w, low_52w, avg_close
         """
-        # Use last 252 trading days (approximately 1 year)
-        window_df = df.tail(WEEK_52_WINDOW)
+        # Use last 252 trading days (approximately 1 year), reduced in NumPy
+        closes = df["close"].to_numpy(dtype=np.float64)[-WEEK_52_WINDOW:]
         
         return {
-            "high_52w": float(window_df["close"].max()),
-            "low_52w": float(window_df["close"].min()),
-            "avg_close": float(window_df["close"].mean()),
+            "high_52w": float(closes.max()),
+            "low_52w": float(closes.min()),
+            "avg_close": float(closes.mean()),
         }
     
     @staticmethod
@@ -153,15 +209,46 @@ class AnalyticsService:
         Returns:
             Correlation coefficient (-1 to 1), or None if insufficient data
         """
-        # Align series by index (date)
-        aligned = pd.concat([series1, series2], axis=1, join="inner")
+        # Align series by index (date) on the underlying arrays
+        return AnalyticsService.compute_aligned_correlation(
+            series1.index.to_numpy(),
+            series1.to_numpy(dtype=np.float64),
+            series2.index.to_numpy(),
+            series2.to_numpy(dtype=np.float64),
+        )
+    
+    @staticmethod
+    def compute_aligned_correlation(
+        dates1: np.ndarray,
+        values1: np.ndarray,
+        dates2: np.ndarray,
+        values2: np.ndarray,
+    ) -> Optional[float]:
+        """
+        Calculate Pearson correlation of two series given as parallel arrays.
         
-        if len(aligned) < 30:  # Need sufficient data for meaningful correlation
-            return None
+        The series are aligned on their common dates (each must have unique
+        dates) before correlating. Results are memoized on the array
+        contents, so repeat comparisons over unchanged data are O(1).
+        
+        Returns:
+            Correlation coefficient (-1 to 1), or None if insufficient data
+        """
+        values1 = np.ascontiguousarray(values1, dtype=np.float64)
+        values2 = np.ascontiguousarray(values2, dtype=np.float64)
         
-        corr = aligned.iloc[:, 0].corr(aligned.iloc[:, 1])
+        # Object arrays have no stable byte representation to key on
+        if dates1.dtype == object or dates2.dtype == object:
+            return _aligned_correlation(dates1, values1, dates2, values2)
         
-        return float(corr) if not pd.isna(corr) else None
+        return _cached_aligned_correlation(
+            dates1.dtype.str,
+            np.ascontiguousarray(dates1).tobytes(),
+            values1.tobytes(),
+            dates2.dtype.str,
+            np.ascontiguousarray(dates2).tobytes(),
+            values2.tobytes(),
+        )
     
     @classmethod
     def compute_all_metrics(cls, df: pd.DataFrame) -> pd.DataFrame:
@@ -169,7 +256,8 @@ class AnalyticsService:
         Compute all metrics for a stock's price history.
         
         This is the main entry point called during data ingestion.
-        All metrics are computed in a single vectorized pass.
+        All metrics are computed in a single fused pass over the prices
+        (see analytics_kernels.compute_all).
         
         Args:
             df: DataFrame with columns: date, open, high, low, close, volume
@@ -179,16 +267,72 @@ class AnalyticsService:
             DataFrame with additional columns: daily_return, ma_7, ma_20, 
             volatility_20d, rsi_14
         """
-        df = df.copy()
-        
-        # Ensure sorted by date (critical for time-series)
+        # Ensure sorted by date (critical for time-series). sort_values
+        # returns a new frame, so the caller's DataFrame is never modified
         df = df.sort_values("date").reset_index(drop=True)
         
+        # Kernel inputs: 1-D contiguous float64 columns (a no-op for the
+        # usual column-wise frames; copies only strided or non-float data)
+        open_ = np.ascontiguousarray(df["open"].to_numpy(dtype=np.float64))
+        close = np.ascontiguousarray(df["close"].to_numpy(dtype=np.float64))
+        
         # Compute all metrics
-        df["daily_return"] = cls.compute_daily_return(df)
-        df["ma_7"] = cls.compute_moving_average(df["close"], MA_WINDOW_7)
-        df["ma_20"] = cls.compute_moving_average(df["close"], MA_WINDOW_20)
-        df["volatility_20d"] = cls.compute_volatility(df["daily_return"], VOLATILITY_WINDOW)
-        df["rsi_14"] = cls.compute_rsi(df["close"], RSI_WINDOW)
+        (
+            df["daily_return"],
+            df["ma_7"],
+            df["ma_20"],
+            df["volatility_20d"],
+            df["rsi_14"],
+        ) = compute_all(
+            open_,
+            close,
+            MA_WINDOW_7,
+            MA_WINDOW_20,
+            VOLATILITY_WINDOW,
+            RSI_WINDOW,
+        )
+        
+        return df
+    
+    @classmethod
+    def compute_all_metrics_grouped(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compute all metrics for many stocks' price histories at once.
+        
+        Same metrics as compute_all_metrics, computed per symbol in a single
+        kernel call over the whole long-format frame instead of one call
+        (and one sort and copy) per symbol.
+        
+        Args:
+            df: Long-format DataFrame with columns: symbol, date, open, high,
+                low, close, volume (any row order)
+        
+        Returns:
+            DataFrame sorted by (symbol, date) with the same additional
+            columns as compute_all_metrics
+        """
+        df = df.sort_values(["symbol", "date"]).reset_index(drop=True)
+        
+        # Group boundaries: positions where the symbol changes
+        symbols = df["symbol"].to_numpy()
+        starts = np.concatenate((
+            [0],
+            np.flatnonzero(symbols[1:] != symbols[:-1]) + 1,
+            [len(df)],
+        )).astype(np.int64)
+        
+        metrics = compute_all_grouped(
+            np.ascontiguousarray(df["open"].to_numpy(dtype=np.float64)),
+            np.ascontiguousarray(df["close"].to_numpy(dtype=np.float64)),
+            starts,
+            MA_WINDOW_7,
+            MA_WINDOW_20,
+            VOLATILITY_WINDOW,
+            RSI_WINDOW,
+        )
+        for column, values in zip(
+            ("daily_return", "ma_7", "ma_20", "volatility_20d", "rsi_14"), metrics
+        ):
+            df[column] = values
         
         return df
@@ -0,0 +1,176 @@
+"""
+Numba-compiled kernels for the rolling analytics metrics.
+
+Each kernel walks its input once with O(1) work per element, replacing
+the pandas rolling/ewm machinery used at ingestion. Inputs must be
+contiguous float64 arrays and, apart from leading NaNs, free of missing
+values (clean_data forward/back-fills before analytics run).
+
+Outputs follow the pandas conventions they replace: NaN until a full
+window of observations is available.
+"""
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    """Simple moving average via a running sum (add newest, drop oldest)."""
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    total = 0.0
+    for i in range(n):
+        total += x[i]
+        if i >= window:
+            total -= x[i - window]
+        if i >= window - 1:
+            out[i] = total / window
+    return out
+
+
+@njit(cache=True)
+def wilder_ema(x: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder smoothing: EMA with alpha = 1/window.
+
+    Leading NaNs are skipped. The average is seeded with the simple mean of
+    the first `window` values (reported at that position), then updated as
+    avg += (x - avg) / window.
+    """
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    start = 0
+    while start < n and np.isnan(x[start]):
+        start += 1
+    if n - start < window:
+        return out
+    seed_end = start + window
+    avg = x[start:seed_end].mean()
+    out[seed_end - 1] = avg
+    for i in range(seed_end, n):
+        avg += (x[i] - avg) / window
+        out[i] = avg
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def compute_all(
+    open_: np.ndarray,
+    close: np.ndarray,
+    w_ma_short: int,
+    w_ma_long: int,
+    w_vol: int,
+    w_rsi: int,
+):
+    """
+    Fused single pass producing every stored metric.
+    
+    Returns:
+        (daily_return, ma_short, ma_long, volatility, rsi) float64 arrays.
+        daily_return is 0 where open is 0, so it is never NaN/inf.
+        volatility is the rolling sample std of daily returns, annualized
+        by sqrt(252). RSI uses Wilder smoothing seeded with the simple
+        average of the first `w_rsi` gains/losses.
+    """
+    n = close.shape[0]
+    daily_return = np.empty(n)
+    ma_short = np.full(n, np.nan)
+    ma_long = np.full(n, np.nan)
+    volatility = np.full(n, np.nan)
+    rsi = np.full(n, np.nan)
+    
+    annualize = np.sqrt(252.0)
+    sum_short = 0.0
+    sum_long = 0.0
+    ret_mean = 0.0
+    ret_m2 = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+    
+    for i in range(n):
+        c = close[i]
+        r = (c - open_[i]) / open_[i] if open_[i] != 0.0 else 0.0
+        daily_return[i] = r
+        
+        # Moving averages: running sums
+        sum_short += c
+        sum_long += c
+        if i >= w_ma_short:
+            sum_short -= close[i - w_ma_short]
+        if i >= w_ma_long:
+            sum_long -= close[i - w_ma_long]
+        if i >= w_ma_short - 1:
+            ma_short[i] = sum_short / w_ma_short
+        if i >= w_ma_long - 1:
+            ma_long[i] = sum_long / w_ma_long
+        
+        # Volatility: sliding-window Welford over daily returns
+        if i < w_vol:
+            delta = r - ret_mean
+            ret_mean += delta / (i + 1)
+            ret_m2 += delta * (r - ret_mean)
+        else:
+            old = daily_return[i - w_vol]
+            prev_mean = ret_mean
+            ret_mean += (r - old) / w_vol
+            ret_m2 += (r - old) * (r - ret_mean + old - prev_mean)
+            if ret_m2 < 0.0:
+                ret_m2 = 0.0
+        if i >= w_vol - 1:
+            volatility[i] = np.sqrt(ret_m2 / (w_vol - 1)) * annualize
+        
+        # RSI: Wilder smoothing of close-to-close gains and losses
+        if i == 0:
+            continue
+        change = c - close[i - 1]
+        gain = change if change > 0.0 else 0.0
+        loss = -change if change < 0.0 else 0.0
+        if i <= w_rsi:
+            # Seed with the simple average of the first w_rsi changes
+            avg_gain += gain / w_rsi
+            avg_loss += loss / w_rsi
+            if i < w_rsi:
+                continue
+        else:
+            avg_gain += (gain - avg_gain) / w_rsi
+            avg_loss += (loss - avg_loss) / w_rsi
+        if avg_loss > 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            rsi[i] = 100.0
+    
+    return daily_return, ma_short, ma_long, volatility, rsi
+
+
+@njit(cache=True, fastmath=True)
+def compute_all_grouped(
+    open_: np.ndarray,
+    close: np.ndarray,
+    starts: np.ndarray,
+    w_ma_short: int,
+    w_ma_long: int,
+    w_vol: int,
+    w_rsi: int,
+) -> np.ndarray:
+    """
+    compute_all over many series stored back to back.
+    
+    Group g occupies [starts[g], starts[g + 1]), so starts has one more
+    entry than there are groups and ends with len(close). Every window
+    restarts at a group boundary.
+    
+    Returns:
+        (5, n) float64 array whose rows are daily_return, ma_short,
+        ma_long, volatility and rsi, as returned by compute_all.
+    """
+    n = close.shape[0]
+    out = np.empty((5, n))
+    for g in range(starts.shape[0] - 1):
+        lo = starts[g]
+        hi = starts[g + 1]
+        metrics = compute_all(
+            open_[lo:hi], close[lo:hi], w_ma_short, w_ma_long, w_vol, w_rsi
+        )
+        for k in range(5):
+            out[k, lo:hi] = metrics[k]
+    return out
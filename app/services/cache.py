@@ -0,0 +1,53 @@
+"""
+In-memory TTL cache shared by the service and API layers.
+
+Market data changes at most once per trading day (after ingestion), so
+short-lived caching of query results and rendered responses is safe.
+Entries expire per-key; ingestion runs in a separate process, so
+staleness is bounded by each entry's TTL.
+
+Backed by a size-bounded cachetools.TLRUCache: expired entries are evicted
+as new ones are stored (not only when re-read), and least recently used
+entries are dropped once CACHE_MAX_ENTRIES is reached. A lock guards
+access from threadpool workers.
+"""
+import time
+from threading import RLock
+from typing import Any, Optional, Tuple
+
+from cachetools import TLRUCache
+
+from app.config import CACHE_MAX_ENTRIES, CACHE_TTL_SECONDS
+
+
+def _time_to_use(key: str, entry: Tuple[Any, int], now: float) -> float:
+    """Expiry time for an entry stored as (value, ttl)."""
+    return now + entry[1]
+
+
+# Format: {key: (value, ttl)}
+_CACHE = TLRUCache(maxsize=CACHE_MAX_ENTRIES, ttu=_time_to_use, timer=time.monotonic)
+_LOCK = RLock()
+
+
+def get_from_cache(key: str) -> Optional[Any]:
+    """Retrieve value from cache if valid."""
+    with _LOCK:
+        entry = _CACHE.get(key)
+    return entry[0] if entry is not None else None
+
+
+def set_to_cache(key: str, value: Any, ttl: int = CACHE_TTL_SECONDS) -> None:
+    """Store value in cache for `ttl` seconds."""
+    with _LOCK:
+        _CACHE[key] = (value, ttl)
+
+
+def clear_cache(prefix: Optional[str] = None) -> None:
+    """Drop all cached entries, or only those whose key starts with `prefix`."""
+    with _LOCK:
+        if prefix is None:
+            _CACHE.clear()
+            return
+        for key in [k for k in _CACHE if k.startswith(prefix)]:
+            del _CACHE[key]
@@ -5,35 +5,44 @@ All database queries are centralized here.
 API routes should only call service methods, never raw queries.
 """
 from datetime import date, timedelta
-from typing import List, Optional, Tuple
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-import pandas as pd
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Integer, Row, desc, func, select, type_coerce
+from sqlalchemy.orm import load_only
+import numpy as np
 
-from app.db.models import Company, DailyPrice
+from app.db.models import Company, DailyPrice, LatestSnapshot, TopMover
 from app.config import DEFAULT_DAYS, WEEK_52_WINDOW
 from app.services.analytics import AnalyticsService
-import time
+from app.services.cache import get_from_cache, set_to_cache
 
-# Simple in-memory cache
-# Format: {key: (value, timestamp)}
-_CACHE = {}
-_TTL_SECONDS = 300  # 5 minutes
-
-def _get_from_cache(key: str):
-    """Retrieve value from cache if valid."""
-    if key in _CACHE:
-        value, timestamp = _CACHE[key]
-        if time.time() - timestamp < _TTL_SECONDS:
-            return value
-        else:
-            del _CACHE[key]
-    return None
-
-def _set_to_cache(key: str, value):
-    """Store value in cache with current timestamp."""
-    _CACHE[key] = (value, time.time())
 
+# Columns actually read by each query path; everything else (e.g. created_at)
+# is left unloaded so rows are cheaper to hydrate. symbol is kept for __repr__.
+_PRICE_RESPONSE_COLUMNS = (
+    DailyPrice.symbol,
+    DailyPrice.date,
+    DailyPrice.open,
+    DailyPrice.high,
+    DailyPrice.low,
+    DailyPrice.close,
+    DailyPrice.volume,
+    DailyPrice.daily_return,
+    DailyPrice.ma_7,
+    DailyPrice.ma_20,
+    DailyPrice.volatility_20d,
+    DailyPrice.rsi_14,
+)
+_LATEST_ANALYTICS_COLUMNS = (
+    DailyPrice.symbol,
+    DailyPrice.date,
+    DailyPrice.close,
+    DailyPrice.daily_return,
+    DailyPrice.ma_7,
+    DailyPrice.ma_20,
+    DailyPrice.volatility_20d,
+    DailyPrice.rsi_14,
+)
 
 
 class DataService:
@@ -43,57 +52,138 @@ class DataService:
     Provides type-safe methods for all database operations.
     """
     
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         self.db = db
     
     # === Company Operations ===
     
-    def get_all_companies(self) -> List[Company]:
+    async def get_all_companies(self) -> List[Company]:
         """Retrieve all tracked companies (Cached)."""
         cache_key = "all_companies"
-        cached = _get_from_cache(cache_key)
+        cached = get_from_cache(cache_key)
         if cached:
             return cached
             
-        companies = self.db.query(Company).order_by(Company.symbol).all()
-        _set_to_cache(cache_key, companies)
+        result = await self.db.execute(select(Company).order_by(Company.symbol))
+        companies = list(result.scalars().all())
+        
+        # Detach so cached rows outlive this request's session
+        for company in companies:
+            self.db.expunge(company)
+        
+        set_to_cache(cache_key, companies)
         return companies
     
-    def get_company_by_symbol(self, symbol: str) -> Optional[Company]:
+    async def get_company_map(self) -> Dict[str, Company]:
+        """
+        Symbol -> Company lookup table (Cached).
+        
+        The company list is tiny and changes only at ingestion, so all
+        single-symbol lookups are served from this map instead of SQL.
+        """
+        cache_key = "company_map"
+        cached = get_from_cache(cache_key)
+        if cached:
+            return cached
+        
+        company_map = {c.symbol: c for c in await self.get_all_companies()}
+        set_to_cache(cache_key, company_map)
+        return company_map
+    
+    async def get_company_by_symbol(self, symbol: str) -> Optional[Company]:
         """Get company by stock symbol."""
-        return self.db.query(Company).filter(Company.symbol == symbol).first()
+        return (await self.get_company_map()).get(symbol)
     
-    def symbol_exists(self, symbol: str) -> bool:
+    async def get_companies_by_symbols(self, symbols: Iterable[str]) -> Dict[str, Company]:
+        """
+        Resolve several symbols at once.
+        
+        Returns:
+            Mapping of symbol -> Company for the symbols that exist
+        """
+        company_map = await self.get_company_map()
+        return {s: company_map[s] for s in set(symbols) if s in company_map}
+    
+    async def symbol_exists(self, symbol: str) -> bool:
         """Check if a symbol exists in the database."""
-        return self.db.query(Company).filter(Company.symbol == symbol).count() > 0
+        return symbol in await self.get_company_map()
     
     # === Price Data Operations ===
     
-    def get_recent_prices(
+    async def get_recent_prices(
         self, 
         symbol: str, 
-        days: int = DEFAULT_DAYS
+        days: int = DEFAULT_DAYS,
+        ascending: bool = True,
     ) -> List[DailyPrice]:
         """
         Get last N days of price data (Cached).
+        
+        The newest N rows are picked by a DESC LIMIT subquery and then
+        ordered in SQL (oldest first by default), using the (symbol, date)
+        index rather than a Python-side sort.
+        
+        Joined against companies so an unknown symbol yields an empty list,
+        letting callers derive a 404 without a separate existence check.
         """
-        cache_key = f"prices_{symbol}_{days}"
-        cached = _get_from_cache(cache_key)
+        cache_key = f"prices_{symbol}_{days}_{'asc' if ascending else 'desc'}"
+        cached = get_from_cache(cache_key)
         if cached:
             return cached
 
-        prices = (
-            self.db.query(DailyPrice)
-            .filter(DailyPrice.symbol == symbol)
+        recent_ids = (
+            select(DailyPrice.id)
+            .join(Company, Company.symbol == DailyPrice.symbol)
+            .where(Company.symbol == symbol)
             .order_by(desc(DailyPrice.date))
             .limit(days)
-            .all()
         )
+        result = await self.db.execute(
+            select(DailyPrice)
+            .options(load_only(*_PRICE_RESPONSE_COLUMNS))
+            .where(DailyPrice.id.in_(recent_ids))
+            .order_by(DailyPrice.date if ascending else desc(DailyPrice.date))
+        )
+        prices = list(result.scalars().all())
         
-        _set_to_cache(cache_key, prices)
+        set_to_cache(cache_key, prices)
         return prices
     
-    def get_price_history(
+    async def get_recent_closes(
+        self,
+        symbol: str,
+        days: int = DEFAULT_DAYS,
+        ascending: bool = True,
+    ) -> List[Row]:
+        """
+        Get last N days of (date, close) tuples (Cached).
+        
+        Column-only fetch for model inputs: no ORM instances are built.
+        Ordered in SQL like get_recent_prices; empty for unknown symbols.
+        """
+        cache_key = f"closes_{symbol}_{days}_{'asc' if ascending else 'desc'}"
+        cached = get_from_cache(cache_key)
+        if cached:
+            return cached
+        
+        recent = (
+            select(DailyPrice.date, DailyPrice.close)
+            .join(Company, Company.symbol == DailyPrice.symbol)
+            .where(Company.symbol == symbol)
+            .order_by(desc(DailyPrice.date))
+            .limit(days)
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(recent.c.date, recent.c.close)
+            .order_by(recent.c.date if ascending else desc(recent.c.date))
+        )
+        closes = list(result.all())
+        
+        set_to_cache(cache_key, closes)
+        return closes
+    
+    async def get_price_history(
         self,
         symbol: str,
         start_date: Optional[date] = None,
@@ -110,27 +200,83 @@ class DataService:
         Returns:
             List of DailyPrice records, sorted by date ascending
         """
-        query = self.db.query(DailyPrice).filter(DailyPrice.symbol == symbol)
+        query = select(DailyPrice).where(DailyPrice.symbol == symbol)
         
         if start_date:
-            query = query.filter(DailyPrice.date >= start_date)
+            query = query.where(DailyPrice.date >= start_date)
         if end_date:
-            query = query.filter(DailyPrice.date <= end_date)
+            query = query.where(DailyPrice.date <= end_date)
+        
+        result = await self.db.execute(query.order_by(DailyPrice.date))
+        return list(result.scalars().all())
+    
+    async def get_close_histories(
+        self, symbols: Iterable[str]
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get full (date, close) history for several symbols in one query.
+        
+        Returns:
+            Mapping of symbol -> (datetime64[D] dates, float64 closes) arrays,
+            sorted by date ascending
+        """
+        # Read dates as their stored epoch-day integers, which are already
+        # datetime64[D] values, instead of converting each to datetime.date
+        result = await self.db.execute(
+            select(DailyPrice.symbol, type_coerce(DailyPrice.date, Integer), DailyPrice.close)
+            .where(DailyPrice.symbol.in_(set(symbols)))
+            .order_by(DailyPrice.symbol, DailyPrice.date)
+        )
+        
+        rows = result.all()
+        if not rows:
+            return {}
         
-        return query.order_by(DailyPrice.date).all()
+        # Transpose the tuples into columns once, then slice per symbol
+        # (rows are grouped by symbol, so each symbol is one contiguous run)
+        symbol_col, date_col, close_col = zip(*rows)
+        dates = np.array(date_col, dtype=np.int64).astype("datetime64[D]")
+        closes = np.array(close_col, dtype=np.float64)
+        symbols, starts = np.unique(np.array(symbol_col), return_index=True)
+        ends = np.append(starts[1:], len(rows))
+        return {
+            str(symbol): (dates[start:end], closes[start:end])
+            for symbol, start, end in zip(symbols, starts, ends)
+        }
     
-    def get_latest_price(self, symbol: str) -> Optional[DailyPrice]:
-        """Get the most recent price record for a symbol."""
-        return (
-            self.db.query(DailyPrice)
-            .filter(DailyPrice.symbol == symbol)
+    async def get_latest_snapshot(self, symbol: str) -> Optional[LatestSnapshot]:
+        """
+        Read the ingestion-time snapshot for a symbol.
+        
+        Returns:
+            The symbols_latest row, or None if missing or older than the
+            latest trading date (callers then fall back to daily_prices)
+        """
+        snapshot = await self.db.get(LatestSnapshot, symbol)
+        if snapshot is None or snapshot.date != await self.get_latest_trading_date():
+            return None
+        return snapshot
+    
+    async def get_latest_price(self, symbol: str) -> Optional[Union[LatestSnapshot, DailyPrice]]:
+        """Get the most recent analytics snapshot for a symbol (None if unknown)."""
+        # Fast path: single primary-key lookup in symbols_latest
+        snapshot = await self.get_latest_snapshot(symbol)
+        if snapshot:
+            return snapshot
+        
+        result = await self.db.execute(
+            select(DailyPrice)
+            .options(load_only(*_LATEST_ANALYTICS_COLUMNS))
+            .join(Company, Company.symbol == DailyPrice.symbol)
+            .where(Company.symbol == symbol)
             .order_by(desc(DailyPrice.date))
-            .first()
+            .limit(1)
         )
+        return result.scalars().first()
     
     # === Summary Statistics ===
     
-    def get_52_week_summary(self, symbol: str) -> Optional[dict]:
+    async def get_52_week_summary(self, symbol: str) -> Optional[dict]:
         """
         Calculate 52-week summary statistics.
         
@@ -138,36 +284,60 @@ class DataService:
             Dictionary with high_52w, low_52w, avg_close, current_price,
             volatility, rsi, change_52w_pct
         """
-        # Get last 252 trading days
-        prices = (
-            self.db.query(DailyPrice)
-            .filter(DailyPrice.symbol == symbol)
+        # Fast path: statistics materialized by the ingestion job
+        snapshot = await self.get_latest_snapshot(symbol)
+        if snapshot:
+            return {
+                "current_price": snapshot.close,
+                "high_52w": snapshot.high_52w,
+                "low_52w": snapshot.low_52w,
+                "avg_close": round(snapshot.avg_close_52w, 2),
+                "volatility": snapshot.volatility_20d,
+                "rsi": snapshot.rsi_14,
+                "change_52w_pct": round(snapshot.change_52w_pct, 2),
+            }
+        
+        # Fallback: aggregate the last 252 trading days live, in SQL.
+        # Window aggregates over the whole 52-week window are attached to
+        # the newest row, so one result row carries everything
+        window = (
+            select(
+                DailyPrice.date,
+                DailyPrice.close,
+                DailyPrice.volatility_20d,
+                DailyPrice.rsi_14,
+            )
+            .where(DailyPrice.symbol == symbol)
             .order_by(desc(DailyPrice.date))
             .limit(WEEK_52_WINDOW)
-            .all()
+            .subquery()
         )
+        result = await self.db.execute(
+            select(
+                window.c.close,
+                window.c.volatility_20d,
+                window.c.rsi_14,
+                func.max(window.c.close).over().label("high_52w"),
+                func.min(window.c.close).over().label("low_52w"),
+                func.avg(window.c.close).over().label("avg_close"),
+                func.first_value(window.c.close).over(order_by=window.c.date).label("oldest_close"),
+            )
+            .order_by(desc(window.c.date))
+            .limit(1)
+        )
+        current = result.first()
         
-        if not prices:
+        if not current:
             return None
         
-        # Current (most recent) values
-        current = prices[0]
-        
-        # Calculate from price list
-        closes = [p.close for p in prices]
-        high_52w = max(closes)
-        low_52w = min(closes)
-        avg_close = sum(closes) / len(closes)
-        
         # Calculate 52-week change
-        oldest = prices[-1] if len(prices) == WEEK_52_WINDOW else prices[-1]
-        change_52w_pct = ((current.close - oldest.close) / oldest.close) * 100
+        change_52w_pct = ((current.close - current.oldest_close) / current.oldest_close) * 100
         
         return {
             "current_price": current.close,
-            "high_52w": high_52w,
-            "low_52w": low_52w,
-            "avg_close": round(avg_close, 2),
+            "high_52w": current.high_52w,
+            "low_52w": current.low_52w,
+            "avg_close": round(current.avg_close, 2),
             "volatility": current.volatility_20d,
             "rsi": current.rsi_14,
             "change_52w_pct": round(change_52w_pct, 2),
@@ -175,7 +345,7 @@ class DataService:
     
     # === Comparison & Correlation ===
     
-    def get_comparison_data(
+    async def get_comparison_data(
         self, 
         symbol1: str, 
         symbol2: str
@@ -186,36 +356,29 @@ class DataService:
         Returns:
             Tuple of (summary1, summary2, correlation)
         """
-        summary1 = self.get_52_week_summary(symbol1)
-        summary2 = self.get_52_week_summary(symbol2)
+        summary1 = await self.get_52_week_summary(symbol1)
+        summary2 = await self.get_52_week_summary(symbol2)
         
         if not summary1 or not summary2:
             return summary1, summary2, None
         
-        # Calculate correlation from close prices
-        prices1 = self.get_price_history(symbol1)
-        prices2 = self.get_price_history(symbol2)
+        # Calculate correlation from close prices (both series in one round-trip)
+        histories = await self.get_close_histories([symbol1, symbol2])
         
-        if not prices1 or not prices2:
+        if symbol1 not in histories or symbol2 not in histories:
             return summary1, summary2, None
         
-        # Convert to series with date index
-        series1 = pd.Series(
-            [p.close for p in prices1],
-            index=[p.date for p in prices1]
-        )
-        series2 = pd.Series(
-            [p.close for p in prices2],
-            index=[p.date for p in prices2]
+        dates1, closes1 = histories[symbol1]
+        dates2, closes2 = histories[symbol2]
+        correlation = AnalyticsService.compute_aligned_correlation(
+            dates1, closes1, dates2, closes2
         )
         
-        correlation = AnalyticsService.compute_correlation(series1, series2)
-        
         return summary1, summary2, correlation
     
     # === Top Movers ===
     
-    def get_top_movers(self, limit: int = 5) -> Tuple[List[dict], List[dict]]:
+    async def get_top_movers(self, limit: int = 5) -> Tuple[List[dict], List[dict]]:
         """
         Get top gainers and losers based on most recent daily return.
         
@@ -226,44 +389,88 @@ class DataService:
             Tuple of (gainers, losers) as lists of dicts
         """
         # Get the most recent trading date
-        latest_date = (
-            self.db.query(func.max(DailyPrice.date))
-            .scalar()
-        )
+        latest_date = await self.get_latest_trading_date()
         
         if not latest_date:
             return [], []
         
-        # Get all prices for latest date
-        latest_prices = (
-            self.db.query(DailyPrice)
-            .filter(DailyPrice.date == latest_date)
-            .all()
-        )
+        # Fast path: ranking materialized by the ingestion job
+        materialized = await self.get_materialized_top_movers(latest_date, limit)
+        if materialized:
+            return materialized
         
-        # Sort by daily return
-        sorted_prices = sorted(
-            latest_prices,
-            key=lambda p: p.daily_return or 0,
-            reverse=True
+        # Fallback: rank live from daily_prices (e.g. before first ingestion).
+        # Sort and limit in SQL; (date, daily_return) is indexed
+        # Only the needed columns are fetched, as plain tuples; names come
+        # from a join so only the 2 * limit ranked companies are read
+        ranked = (
+            select(
+                DailyPrice.symbol,
+                func.coalesce(Company.name, DailyPrice.symbol).label("name"),
+                DailyPrice.close,
+                DailyPrice.daily_return,
+            )
+            .outerjoin(Company, Company.symbol == DailyPrice.symbol)
+            .where(DailyPrice.date == latest_date)
+            .limit(limit)
         )
+        gainer_rows = await self.db.execute(ranked.order_by(desc(DailyPrice.daily_return)))
+        loser_rows = await self.db.execute(ranked.order_by(DailyPrice.daily_return))
         
-        # Get company names
-        companies = {c.symbol: c.name for c in self.get_all_companies()}
-        
-        def to_mover_dict(price: DailyPrice) -> dict:
+        def to_mover_dict(row: Row) -> dict:
             return {
-                "symbol": price.symbol,
-                "name": companies.get(price.symbol, price.symbol),
-                "close": price.close,
-                "change_pct": round((price.daily_return or 0) * 100, 2),
+                "symbol": row.symbol,
+                "name": row.name,
+                "close": row.close,
+                "change_pct": round(row.daily_return * 100, 2),
             }
         
-        gainers = [to_mover_dict(p) for p in sorted_prices[:limit]]
-        losers = [to_mover_dict(p) for p in sorted_prices[-limit:][::-1]]
+        gainers = [to_mover_dict(r) for r in gainer_rows]
+        losers = [to_mover_dict(r) for r in loser_rows]
         
         return gainers, losers
     
-    def get_latest_trading_date(self) -> Optional[date]:
+    async def get_materialized_top_movers(
+        self,
+        trading_date: date,
+        limit: int = 5,
+    ) -> Optional[Tuple[List[dict], List[dict]]]:
+        """
+        Read the ingestion-time top movers for a date.
+        
+        Returns:
+            Tuple of (gainers, losers), or None if nothing was materialized
+        """
+        result = await self.db.execute(
+            select(TopMover)
+            .where(TopMover.date == trading_date, TopMover.rank <= limit)
+            .order_by(TopMover.kind, TopMover.rank)
+        )
+        rows = result.scalars().all()
+        if not rows:
+            return None
+        
+        def to_mover_dict(mover: TopMover) -> dict:
+            return {
+                "symbol": mover.symbol,
+                "name": mover.name,
+                "close": mover.close,
+                "change_pct": mover.change_pct,
+            }
+        
+        gainers = [to_mover_dict(m) for m in rows if m.kind == "gainer"]
+        losers = [to_mover_dict(m) for m in rows if m.kind == "loser"]
+        return gainers, losers
+    
+    async def get_latest_trading_date(self) -> Optional[date]:
         """Get the most recent trading date in the database."""
-        return self.db.query(func.max(DailyPrice.date)).scalar()
+        cache_key = "latest_trading_date"
+        cached = get_from_cache(cache_key)
+        if cached is not None:
+            return cached
+        
+        result = await self.db.execute(select(func.max(DailyPrice.date)))
+        latest_date = result.scalar()
+        if latest_date:
+            set_to_cache(cache_key, latest_date)
+        return latest_date
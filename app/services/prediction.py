@@ -4,9 +4,49 @@ Prediction Service
 Provides basic ML-based price forecasting using Linear Regression.
 This is a simplified model for demonstration purposes.
 """
+import bisect
+import functools
 import numpy as np
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Tuple
+from datetime import date
+
+
+@functools.lru_cache(maxsize=1024)
+def _fit_linear_trend(prices_bytes: bytes) -> Optional[Tuple[float, float, float]]:
+    """
+    Closed-form OLS fit of price against day index (Memoized).
+    
+    Keyed on the raw float64 bytes of the training window, so repeat
+    forecasts over unchanged data skip the regression entirely; new data
+    changes the bytes and therefore the key.
+    
+    Returns:
+        (slope, intercept, r_squared), or None if the fit is degenerate
+    """
+    y = np.frombuffer(prices_bytes, dtype=np.float64)
+    n = len(y)
+    
+    # Feature: day index (0, 1, ..., n-1). Its mean and sum of squared
+    # deviations have closed forms, so no feature arrays are needed for them
+    X_mean = (n - 1) / 2.0
+    denominator = n * (n * n - 1) / 12.0
+    
+    if denominator == 0:
+        return None
+    
+    # Simple Linear Regression (closed-form solution). The centered feature
+    # sums to zero, so dot(x - x_mean, y) == sum((x - x_mean) * (y - y_mean))
+    y_mean = y.mean()
+    numerator = np.dot(np.arange(n) - X_mean, y)
+    
+    slope = numerator / denominator
+    intercept = y_mean - slope * X_mean
+    
+    # R-squared for confidence metric (ss_res = ss_tot - slope * numerator)
+    ss_tot = np.dot(y - y_mean, y - y_mean)
+    r_squared = (slope * numerator) / ss_tot if ss_tot > 0 else 0
+    
+    return float(slope), float(intercept), float(r_squared)
 
 
 class PredictionService:
@@ -19,13 +59,13 @@ class PredictionService:
     FORECAST_DAYS = 7   # Predict next 7 days
     
     @staticmethod
-    def predict_prices(prices: List[float], dates: List[str]) -> Dict[str, Any]:
+    def predict_prices(prices: np.ndarray, last_date: date) -> Dict[str, Any]:
         """
         Generate price predictions using Linear Regression.
         
         Args:
-            prices: List of closing prices (chronological order)
-            dates: List of date strings corresponding to prices
+            prices: float64 array of closing prices (chronological order)
+            last_date: Date of the most recent price (forecast starts after it)
             
         Returns:
             Dict with prediction data and model metrics
@@ -41,46 +81,31 @@ class PredictionService:
         lookback = min(PredictionService.LOOKBACK_DAYS, len(prices))
         train_prices = prices[-lookback:]
         
-        # Feature: day index (0, 1, 2, ...)
-        X = np.arange(lookback).reshape(-1, 1)
-        y = np.array(train_prices)
-        
-        # Simple Linear Regression (closed-form solution)
-        X_mean = np.mean(X)
-        y_mean = np.mean(y)
-        
-        numerator = np.sum((X.flatten() - X_mean) * (y - y_mean))
-        denominator = np.sum((X.flatten() - X_mean) ** 2)
-        
-        if denominator == 0:
+        fit = _fit_linear_trend(np.ascontiguousarray(train_prices, dtype=np.float64).tobytes())
+        if fit is None:
             return {"error": "Cannot compute regression", "predictions": [], "confidence": 0}
-        
-        slope = numerator / denominator
-        intercept = y_mean - slope * X_mean
-        
-        # R-squared for confidence metric
-        y_pred_train = slope * X.flatten() + intercept
-        ss_res = np.sum((y - y_pred_train) ** 2)
-        ss_tot = np.sum((y - y_mean) ** 2)
-        r_squared = 1 - (ss_res / ss_tot) if ss_tot > 0 else 0
+        slope, intercept, r_squared = fit
         
         # Generate future predictions
-        last_date = datetime.strptime(dates[-1], "%Y-%m-%d")
         future_X = np.arange(lookback, lookback + PredictionService.FORECAST_DAYS)
         future_prices = slope * future_X + intercept
         
-        predictions = []
-        for i, price in enumerate(future_prices):
-            future_date = last_date + timedelta(days=i + 1)
-            # Skip weekends (simple approximation)
-            while future_date.weekday() >= 5:
-                future_date += timedelta(days=1)
-            
-            predictions.append({
-                "date": future_date.strftime("%Y-%m-%d"),
+        # Next FORECAST_DAYS business days after last_date (rolling a
+        # weekend last_date back to Friday so Monday is the first step)
+        future_dates = np.busday_offset(
+            np.datetime64(last_date, "D"),
+            np.arange(1, PredictionService.FORECAST_DAYS + 1),
+            roll="backward",
+        )
+        
+        predictions = [
+            {
+                "date": str(future_date),
                 "predicted_price": round(float(price), 2),
                 "is_forecast": True
-            })
+            }
+            for future_date, price in zip(future_dates, future_prices)
+        ]
         
         # Trend direction
         trend = "bullish" if slope > 0 else "bearish" if slope < 0 else "neutral"
@@ -103,7 +128,19 @@ class SentimentService:
     Combines RSI, volatility, and price momentum into a composite score.
     """
     
+    # Score thresholds and the (interpretation, label) for each band:
+    # LEVELS[i] covers LEVEL_BINS[i-1] <= score < LEVEL_BINS[i]
+    LEVEL_BINS = (30, 45, 55, 70)
+    LEVELS = (
+        ("strong_bearish", "Strong Sell Signal"),
+        ("bearish", "Bearish"),
+        ("neutral", "Neutral"),
+        ("bullish", "Bullish"),
+        ("strong_bullish", "Strong Buy Signal"),
+    )
+    
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def calculate_sentiment(
         rsi: Optional[float],
         volatility: Optional[float],
@@ -115,6 +152,9 @@ class SentimentService:
         """
         Calculate a mock sentiment index (0-100).
         
+        Pure function of its six inputs, so results are memoized; treat
+        the returned dict as read-only.
+        
         Components:
         - RSI contribution (40%): Normalized RSI
         - Volatility contribution (20%): Lower volatility = more positive
@@ -186,21 +226,9 @@ class SentimentService:
         )
         
         # Interpret
-        if final_score >= 70:
-            interpretation = "strong_bullish"
-            label = "Strong Buy Signal"
-        elif final_score >= 55:
-            interpretation = "bullish"
-            label = "Bullish"
-        elif final_score >= 45:
-            interpretation = "neutral"
-            label = "Neutral"
-        elif final_score >= 30:
-            interpretation = "bearish"
-            label = "Bearish"
-        else:
-            interpretation = "strong_bearish"
-            label = "Strong Sell Signal"
+        interpretation, label = SentimentService.LEVELS[
+            bisect.bisect_right(SentimentService.LEVEL_BINS, final_score)
+        ]
         
         return {
             "sentiment_score": round(final_score, 1),
@@ -2,24 +2,29 @@
 Data ingestion script for fetching stock data from yfinance.
 
 This script:
-1. Fetches 2 years of historical data for each Indian stock
+1. Fetches 2 years of historical data for all Indian stocks in one parallel download
 2. Cleans and validates the data
 3. Computes all analytics metrics
 4. Stores everything in SQLite
 
 Usage:
-    python scripts/data_ingestion.py
+    python scripts/data_ingestion.py [-v]
     
 The script is idempotent - running it multiple times will update existing data.
 """
+import asyncio
+import logging
 import sys
-import time
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import requests_cache
 import yfinance as yf
+from requests.adapters import HTTPAdapter
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.sqlite import insert
 
@@ -31,48 +36,168 @@ from app.config import (
     HISTORY_PERIOD,
     MAX_RETRIES,
     RETRY_BACKOFF_SECONDS,
+    FETCH_CONCURRENCY,
+    TOP_MOVERS_MAX_LIMIT,
+    WEEK_52_WINDOW,
+    YF_CACHE_PATH,
+    YF_CACHE_EXPIRE_SECONDS,
+    YF_HTTP_POOL_SIZE,
 )
 from app.db.database import SessionLocal, init_db
-from app.db.models import Company, DailyPrice
+from app.db.models import Company, DailyPrice, LatestSnapshot, TopMover
 from app.services.analytics import AnalyticsService
 
 
-def fetch_stock_data(symbol: str, period: str = HISTORY_PERIOD) -> Optional[pd.DataFrame]:
+log = logging.getLogger(__name__)
+
+# Shared HTTP session for every yfinance call: responses are cached on disk,
+# so re-running ingestion within the expiry window skips the network
+yf_session = requests_cache.CachedSession(
+    str(YF_CACHE_PATH),
+    backend="sqlite",
+    expire_after=YF_CACHE_EXPIRE_SECONDS,
+    stale_if_error=True,
+)
+
+# Keep-alive connection pool sized for the concurrent fetches, so cache
+# misses reuse open TLS connections instead of handshaking per request.
+# Retries are handled by fetch_stock_data's backoff
+yf_session.mount(
+    "https://",
+    HTTPAdapter(pool_connections=YF_HTTP_POOL_SIZE, pool_maxsize=YF_HTTP_POOL_SIZE, max_retries=0),
+)
+
+
+async def fetch_stock_data(
+    symbol: str,
+    period: str = HISTORY_PERIOD,
+    start: Optional[date] = None,
+) -> Optional[pd.DataFrame]:
     """
     Fetch historical data from yfinance with retry logic.
     
+    The blocking yfinance call runs in a worker thread and retry backoff
+    is awaited, so concurrent fetches overlap their I/O and waits.
+    
     Args:
         symbol: Stock symbol (e.g., RELIANCE.NS)
         period: History period (e.g., "2y" for 2 years)
+        start: If given, fetch from this date (inclusive) instead of `period`
         
     Returns:
         DataFrame with OHLCV data, or None if fetch failed
     """
     for attempt in range(MAX_RETRIES):
         try:
-            ticker = yf.Ticker(symbol)
-            df = ticker.history(period=period)
+            ticker = yf.Ticker(symbol, session=yf_session)
+            if start:
+                df = await asyncio.to_thread(ticker.history, start=start)
+            else:
+                df = await asyncio.to_thread(ticker.history, period=period)
             
             if df.empty:
-                print(f"  ⚠ No data returned for {symbol}")
+                log.warning("  ⚠ No data returned for %s", symbol)
                 return None
             
             return df
             
         except Exception as e:
             wait_time = RETRY_BACKOFF_SECONDS * (2 ** attempt)
-            print(f"  ⚠ Attempt {attempt + 1} failed: {e}")
+            log.warning("  ⚠ %s: attempt %d failed: %s", symbol, attempt + 1, e)
             
             if attempt < MAX_RETRIES - 1:
-                print(f"    Retrying in {wait_time:.1f}s...")
-                time.sleep(wait_time)
+                log.info("    Retrying %s in %.1fs...", symbol, wait_time)
+                await asyncio.sleep(wait_time)
             else:
-                print(f"  ✗ Failed to fetch {symbol} after {MAX_RETRIES} attempts")
+                log.error("  ✗ Failed to fetch %s after %d attempts", symbol, MAX_RETRIES)
                 return None
     
     return None
 
 
+async def fetch_missing_stock_data(
+    symbols: List[str],
+    starts: Dict[str, date],
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch symbols individually and concurrently (bulk download fallback).
+    
+    At most FETCH_CONCURRENCY requests are in flight at once.
+    
+    Args:
+        symbols: Stock symbols to fetch
+        starts: Per-symbol start date for delta fetches; symbols without
+            one fetch the full HISTORY_PERIOD
+        
+    Returns:
+        Dict mapping symbol -> DataFrame for every symbol that succeeded
+    """
+    semaphore = asyncio.Semaphore(FETCH_CONCURRENCY)
+    
+    async def fetch(symbol: str) -> Optional[pd.DataFrame]:
+        async with semaphore:
+            return await fetch_stock_data(symbol, start=starts.get(symbol))
+    
+    results = await asyncio.gather(*(fetch(symbol) for symbol in symbols))
+    return {symbol: df for symbol, df in zip(symbols, results) if df is not None}
+
+
+def fetch_all_stock_data(
+    symbols: List[str],
+    period: str = HISTORY_PERIOD,
+    start: Optional[date] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical data for many symbols in one yf.download call.
+    
+    yfinance downloads the tickers concurrently on its own thread pool.
+    Symbols that come back empty are left out of the result so the caller
+    can retry them individually with fetch_missing_stock_data.
+    
+    Args:
+        symbols: Stock symbols (e.g., ["RELIANCE.NS", "TCS.NS"])
+        period: History period (e.g., "2y" for 2 years)
+        start: If given, fetch from this date (inclusive) instead of `period`
+        
+    Returns:
+        Dict mapping symbol -> DataFrame with OHLCV data
+    """
+    window = {"start": start} if start else {"period": period}
+    try:
+        data = yf.download(
+            tickers=" ".join(symbols),
+            **window,
+            group_by="ticker",
+            threads=True,
+            auto_adjust=True,
+            progress=False,
+            session=yf_session,
+        )
+    except Exception as e:
+        log.warning("  ⚠ Bulk download failed: %s", e)
+        return {}
+    
+    if data is None or data.empty:
+        return {}
+    
+    frames = {}
+    for symbol in symbols:
+        if isinstance(data.columns, pd.MultiIndex):
+            if symbol not in data.columns.get_level_values(0):
+                continue
+            df = data.xs(symbol, axis=1, level=0)
+        else:
+            # Single-ticker downloads may come back with flat columns
+            df = data
+        
+        # Rows for dates where only other tickers traded are all-NaN
+        df = df.dropna(how="all")
+        if not df.empty:
+            frames[symbol] = df
+    
+    return frames
+
+
 def clean_data(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     """
     Clean and validate raw yfinance data.
@@ -90,197 +215,430 @@ def clean_data(df: pd.DataFrame, symbol: str) -> pd.DataFrame:
     Returns:
         Cleaned DataFrame ready for analytics
     """
-    # Reset index to make date a column
-    df = df.reset_index()
-    
-    # Normalize column names
-    df.columns = [c.lower().replace(" ", "_") for c in df.columns]
+    # Build the output frame in one go from the raw index and columns,
+    # normalizing names ("Open" -> "open", "Stock Splits" -> "stock_splits")
+    source = {c.lower().replace(" ", "_"): c for c in df.columns}
+    price_cols = [c for c in ("open", "high", "low", "close") if c in source]
+    value_cols = price_cols + (["volume"] if "volume" in source else [])
     
-    # Rename 'date' column if it's different
-    if "datetime" in df.columns:
-        df = df.rename(columns={"datetime": "date"})
+    # Date index (Date or Datetime) -> date type (remove time component)
+    dates = pd.DatetimeIndex(df.index)
+    order = None if dates.is_monotonic_increasing else np.argsort(dates, kind="stable")
     
-    # Convert date to date type (remove time component)
-    df["date"] = pd.to_datetime(df["date"]).dt.date
+    # Prices as float64 up front: the analytics kernels and the REAL columns
+    # both take float64, so no later stage has to convert or copy them
+    columns = {"date": dates.date}
+    for col in price_cols:
+        columns[col] = df[source[col]].to_numpy(dtype=np.float64)
+    if "volume" in source:
+        columns["volume"] = df[source["volume"]].to_numpy()
+    if order is not None:
+        # yfinance returns ascending dates, so this is normally skipped
+        columns = {col: values[order] for col, values in columns.items()}
+    out = pd.DataFrame(columns)
     
-    # Keep only required columns
-    required_cols = ["date", "open", "high", "low", "close", "volume"]
-    df = df[[c for c in required_cols if c in df.columns]]
+    # Handle missing values with forward fill (back fill for leading NaNs),
+    # filling the frame in place rather than rebinding two new copies. Clean
+    # bars (the common case) cost one any() scan per float column
+    float_cols = [col for col in value_cols if columns[col].dtype.kind == "f"]
+    if any(np.isnan(columns[col]).any() for col in float_cols):
+        missing_before = int(out[value_cols].isna().to_numpy().sum())
+        out.ffill(inplace=True)
+        out.bfill(inplace=True)
+        log.debug("  ℹ %s: filled %d missing values", symbol, missing_before)
     
-    # Handle missing values with forward fill
-    missing_before = df.isnull().sum().sum()
-    df = df.ffill()
-    df = df.bfill()  # Backfill for any leading NaNs
-    missing_after = df.isnull().sum().sum()
+    # Volume arrives as float when yfinance pads missing rows with NaN;
+    # once filled, store it as int64 (BIGINT)
+    volume = out.get("volume")
+    if volume is not None and volume.dtype.kind == "f" and not volume.isna().any():
+        out["volume"] = volume.astype(np.int64)
     
-    if missing_before > 0:
-        print(f"  ℹ Filled {missing_before} missing values")
+    # Validate in one pass: every price positive and high >= low
+    valid = (out[price_cols].to_numpy() > 0).all(axis=1)
+    if "high" in source and "low" in source:
+        valid &= out["high"].to_numpy() >= out["low"].to_numpy()
     
-    # Validate: no negative prices
-    price_cols = ["open", "high", "low", "close"]
-    for col in price_cols:
-        if col in df.columns:
-            invalid = df[df[col] <= 0]
-            if len(invalid) > 0:
-                print(f"  ⚠ Removing {len(invalid)} rows with invalid {col}")
-                df = df[df[col] > 0]
-    
-    # Validate: high >= low
-    if "high" in df.columns and "low" in df.columns:
-        invalid = df[df["high"] < df["low"]]
-        if len(invalid) > 0:
-            print(f"  ⚠ Removing {len(invalid)} rows with high < low")
-            df = df[df["high"] >= df["low"]]
+    invalid_count = int((~valid).sum())
+    if invalid_count > 0:
+        log.warning("  ⚠ %s: removing %d rows with invalid prices", symbol, invalid_count)
+        out = out.loc[valid].reset_index(drop=True)
     
     # Add symbol column
-    df["symbol"] = symbol
+    out["symbol"] = symbol
+    
+    return out
+
+
+def get_latest_dates(db: Session) -> Dict[str, date]:
+    """Most recent stored trading date for every symbol with price data."""
+    rows = db.query(DailyPrice.symbol, func.max(DailyPrice.date)).group_by(DailyPrice.symbol)
+    return {symbol: latest for symbol, latest in rows}
+
+
+def merge_with_history(db: Session, df: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """
+    Prepend a symbol's stored OHLCV history to newly fetched rows.
     
-    # Sort by date
-    df = df.sort_values("date").reset_index(drop=True)
+    Rolling metrics need the preceding window of prices, so a delta fetch
+    is analysed together with what is already stored. Fetched rows win on
+    overlapping dates.
+    
+    Args:
+        db: Database session
+        df: Cleaned DataFrame of newly fetched rows
+        symbol: Stock symbol
+        
+    Returns:
+        Combined DataFrame sorted by date, in clean_data's column layout
+    """
+    columns = ["date", "open", "high", "low", "close", "volume"]
+    rows = (
+        db.query(*(getattr(DailyPrice, c) for c in columns))
+        .filter(DailyPrice.symbol == symbol)
+        .order_by(DailyPrice.date)
+        .all()
+    )
+    history = pd.DataFrame(rows, columns=columns)
+    history["symbol"] = symbol
     
-    return df
+    combined = pd.concat([history, df[history.columns]], ignore_index=True)
+    combined = combined.drop_duplicates("date", keep="last")
+    return combined.sort_values("date").reset_index(drop=True)
 
 
-def store_company(db: Session, symbol: str, name: str, sector: str) -> None:
-    """Insert or update company record."""
-    existing = db.query(Company).filter(Company.symbol == symbol).first()
+def store_companies(db: Session, companies: List[Tuple[str, str, str]]) -> None:
+    """
+    Insert or update company records from (symbol, name, sector) tuples.
     
-    if existing:
-        existing.name = name
-        existing.sector = sector
-    else:
-        company = Company(symbol=symbol, name=name, sector=sector)
-        db.add(company)
+    One INSERT ... ON CONFLICT(symbol) DO UPDATE executemany, with no
+    per-company SELECT or ORM objects. Not committed here: the caller
+    commits it together with the run's prices.
+    """
+    if not companies:
+        return
     
-    db.commit()
+    stmt = insert(Company.__table__)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["symbol"],
+        set_={"name": stmt.excluded.name, "sector": stmt.excluded.sector},
+    )
+    db.connection().execute(
+        stmt,
+        [{"symbol": symbol, "name": name, "sector": sector} for symbol, name, sector in companies],
+    )
+
+
+def _column_values(series: pd.Series) -> list:
+    """Column as a list of bind parameters, with NaN as None and int volumes."""
+    values = series.to_numpy()
+    if values.dtype.kind == "f":
+        missing = np.isnan(values)
+        if series.name == "volume":
+            values = np.where(missing, 0, values).astype(np.int64)
+        if missing.any():
+            values = values.astype(object)
+            values[missing] = None
+    return values.tolist()
+
+
+def _build_price_upsert():
+    """INSERT ... ON CONFLICT(symbol, date) DO UPDATE of every price/metric column."""
+    stmt = insert(DailyPrice.__table__)
+    return stmt.on_conflict_do_update(
+        index_elements=["symbol", "date"],
+        set_={
+            column.name: stmt.excluded[column.name]
+            for column in DailyPrice.__table__.c
+            if column.name not in ("id", "symbol", "date", "created_at")
+        },
+    )
+
+
+# Core insert on the Table, built once and reused by every store_prices
+# call, so SQLAlchemy's compiled cache serves the SQL string
+_UPSERT_PRICES = _build_price_upsert()
 
 
 def store_prices(db: Session, df: pd.DataFrame) -> int:
     """
     Upsert price data into database.
     
-    Uses SQLite's INSERT OR REPLACE to handle duplicates.
+    Uses a single INSERT ... ON CONFLICT(symbol, date) DO UPDATE statement,
+    executed once for all rows (executemany), so existing rows are updated
+    in place. Not committed here: the caller commits once per run.
     
     Args:
         db: Database session
-        df: DataFrame with all price and analytics columns
+        df: Long-format DataFrame (one row per symbol and date) with all
+            price and analytics columns
         
     Returns:
         Number of rows inserted/updated
     """
-    records = df.to_dict(orient="records")
+    if df.empty:
+        return 0
     
-    for record in records:
-        # Check for existing record
-        existing = (
-            db.query(DailyPrice)
-            .filter(
-                DailyPrice.symbol == record["symbol"],
-                DailyPrice.date == record["date"]
-            )
-            .first()
+    # Unbox each column once with ndarray.tolist() (native Python floats/ints),
+    # mapping NaN -> NULL; rolling metrics are undefined for the first window days
+    columns = list(df.columns)
+    records = [
+        dict(zip(columns, row))
+        for row in zip(*(_column_values(df[column]) for column in columns))
+    ]
+    
+    # One executemany: the statement binds a single row's parameters per
+    # execution, so SQLite's bound-variable limit does not apply to its size
+    db.connection().execute(_UPSERT_PRICES, records)
+    return len(records)
+
+
+def store_top_movers(db: Session) -> int:
+    """
+    Materialize top gainers/losers for the latest trading date.
+    
+    The API serves /top-movers from this table instead of ranking
+    daily_prices on every request.
+    
+    Returns:
+        Number of rows written
+    """
+    latest_date = db.query(func.max(DailyPrice.date)).scalar()
+    if not latest_date:
+        return 0
+    
+    latest_prices = (
+        db.query(
+            DailyPrice.symbol,
+            func.coalesce(Company.name, DailyPrice.symbol).label("name"),
+            DailyPrice.close,
+            DailyPrice.daily_return,
         )
-        
-        if existing:
-            # Update existing record
-            for key, value in record.items():
-                if key not in ("symbol", "date"):
-                    setattr(existing, key, value if pd.notna(value) else None)
-        else:
-            # Insert new record
-            price = DailyPrice(
-                symbol=record["symbol"],
-                date=record["date"],
-                open=record["open"],
-                high=record["high"],
-                low=record["low"],
-                close=record["close"],
-                volume=int(record.get("volume", 0)) if pd.notna(record.get("volume")) else None,
-                daily_return=record.get("daily_return") if pd.notna(record.get("daily_return")) else None,
-                ma_7=record.get("ma_7") if pd.notna(record.get("ma_7")) else None,
-                ma_20=record.get("ma_20") if pd.notna(record.get("ma_20")) else None,
-                volatility_20d=record.get("volatility_20d") if pd.notna(record.get("volatility_20d")) else None,
-                rsi_14=record.get("rsi_14") if pd.notna(record.get("rsi_14")) else None,
-            )
-            db.add(price)
+        .outerjoin(Company, Company.symbol == DailyPrice.symbol)
+        .filter(DailyPrice.date == latest_date)
+        .all()
+    )
+    
+    # Top-k by daily return via O(n) partition, then sort only those k
+    returns = np.fromiter(
+        (p.daily_return for p in latest_prices), dtype=np.float64, count=len(latest_prices)
+    )
+    k = min(TOP_MOVERS_MAX_LIMIT, len(returns))
+    if k == 0:
+        return 0
+    best = np.argpartition(-returns, k - 1)[:k]
+    worst = np.argpartition(returns, k - 1)[:k]
+    sides = {
+        "gainer": [latest_prices[i] for i in best[np.argsort(-returns[best], kind="stable")]],
+        "loser": [latest_prices[i] for i in worst[np.argsort(returns[worst], kind="stable")]],
+    }
+    
+    records = [
+        {
+            "date": latest_date,
+            "kind": kind,
+            "rank": rank,
+            "symbol": price.symbol,
+            "name": price.name,
+            "close": price.close,
+            "change_pct": round(price.daily_return * 100, 2),
+        }
+        for kind, prices in sides.items()
+        for rank, price in enumerate(prices, 1)
+    ]
+    
+    # Replace any previous ranking for this date
+    table = TopMover.__table__
+    conn = db.connection()
+    conn.execute(table.delete().where(table.c.date == latest_date))
+    conn.execute(table.insert(), records)
     
     db.commit()
     return len(records)
 
 
+def store_latest_snapshots(db: Session) -> int:
+    """
+    Materialize each symbol's latest analytics and 52-week statistics.
+    
+    The API serves /analytics, /summary and /sentiment from symbols_latest
+    with a single primary-key lookup instead of scanning daily_prices.
+    
+    Returns:
+        Number of rows written
+    """
+    snapshots = []
+    for (symbol,) in db.query(Company.symbol).all():
+        # Last 252 trading days, oldest first
+        prices = (
+            db.query(DailyPrice)
+            .filter(DailyPrice.symbol == symbol)
+            .order_by(DailyPrice.date.desc())
+            .limit(WEEK_52_WINDOW)
+            .all()
+        )[::-1]
+        if not prices:
+            continue
+        
+        current, oldest = prices[-1], prices[0]
+        stats = AnalyticsService.compute_52_week_stats(
+            pd.DataFrame({"close": [p.close for p in prices]})
+        )
+        snapshots.append({
+            "symbol": symbol,
+            "date": current.date,
+            "close": current.close,
+            "daily_return": current.daily_return,
+            "ma_7": current.ma_7,
+            "ma_20": current.ma_20,
+            "volatility_20d": current.volatility_20d,
+            "rsi_14": current.rsi_14,
+            "high_52w": stats["high_52w"],
+            "low_52w": stats["low_52w"],
+            "avg_close_52w": stats["avg_close"],
+            "change_52w_pct": (current.close - oldest.close) / oldest.close * 100,
+        })
+    
+    if snapshots:
+        db.connection().execute(insert(LatestSnapshot.__table__).prefix_with("OR REPLACE"), snapshots)
+        db.commit()
+    return len(snapshots)
+
+
 def ingest_all_stocks() -> None:
     """
     Main ingestion pipeline.
     
     Fetches, cleans, computes analytics, and stores data for all stocks.
     """
-    print("=" * 60)
-    print("Stock Data Ingestion Pipeline")
-    print("=" * 60)
-    print(f"Stocks to process: {len(INDIAN_STOCKS)}")
-    print(f"History period: {HISTORY_PERIOD}")
-    print()
+    log.info("=" * 60)
+    log.info("Stock Data Ingestion Pipeline")
+    log.info("=" * 60)
+    log.info("Stocks to process: %d", len(INDIAN_STOCKS))
+    log.info("History period: %s", HISTORY_PERIOD)
     
     # Initialize database
-    print("Initializing database...")
+    log.info("Initializing database...")
     init_db()
     
     db = SessionLocal()
+    companies = []  # (symbol, name, sector) of every symbol with prices
+    frames = []
+    cutoffs = {}  # symbol -> first date to write back
     total_rows = 0
     successful = 0
+    skipped = 0
     failed = 0
     
     try:
+        # Symbols already holding the most recent trading day are skipped;
+        # the rest fetch only what is newer than their stored history
+        latest_dates = get_latest_dates(db)
+        last_trading_day = np.busday_offset(
+            np.datetime64(date.today(), "D"), 0, roll="backward"
+        ).astype(date)
+        current = {s for s, latest in latest_dates.items() if latest >= last_trading_day}
+        stale = [s for s, _, _ in INDIAN_STOCKS if s in latest_dates and s not in current]
+        new = [s for s, _, _ in INDIAN_STOCKS if s not in latest_dates]
+        
+        # Fetch up front in parallel downloads: full history for new symbols,
+        # and everything since the oldest stored date for stale ones
+        log.info("Fetching from yfinance...")
+        fetched = fetch_all_stock_data(new) if new else {}
+        if stale:
+            fetched.update(
+                fetch_all_stock_data(stale, start=min(latest_dates[s] for s in stale))
+            )
+        
+        # Retry symbols missing from the bulk download one by one, concurrently
+        missing = [s for s in new + stale if s not in fetched]
+        if missing:
+            log.info("  → Fetching %d missing symbols individually...", len(missing))
+            fetched.update(asyncio.run(fetch_missing_stock_data(missing, latest_dates)))
+        log.info(
+            "  ✓ Fetched %d/%d symbols (%d already up to date)",
+            len(fetched), len(new) + len(stale), len(current),
+        )
+        
         for i, (symbol, name, sector) in enumerate(INDIAN_STOCKS, 1):
-            print(f"\n[{i}/{len(INDIAN_STOCKS)}] Processing {symbol} ({name})")
+            log.debug("[%d/%d] Processing %s (%s)", i, len(INDIAN_STOCKS), symbol, name)
             
-            # Fetch data
-            print("  → Fetching from yfinance...")
-            raw_df = fetch_stock_data(symbol)
+            since = latest_dates.get(symbol)
+            if symbol in current:
+                log.debug("  ✓ Up to date (%s), skipping", since)
+                companies.append((symbol, name, sector))
+                skipped += 1
+                continue
             
+            raw_df = fetched.get(symbol)
             if raw_df is None:
                 failed += 1
                 continue
             
-            print(f"  → Fetched {len(raw_df)} days of data")
+            log.debug("  → Fetched %d days of data", len(raw_df))
             
             # Clean data
-            print("  → Cleaning and validating...")
+            log.debug("  → Cleaning and validating...")
             cleaned_df = clean_data(raw_df, symbol)
             
-            # Compute analytics
-            print("  → Computing analytics...")
-            final_df = AnalyticsService.compute_all_metrics(cleaned_df)
-            
-            # Store company
-            print("  → Storing company info...")
-            store_company(db, symbol, name, sector)
-            
-            # Store prices
-            print("  → Storing price data...")
-            rows = store_prices(db, final_df)
+            if since is not None:
+                # Delta fetch: recompute over the stored history plus new rows
+                cleaned_df = merge_with_history(db, cleaned_df, symbol)
             
-            total_rows += rows
+            companies.append((symbol, name, sector))
+            frames.append(cleaned_df)
+            cutoffs[symbol] = since or date.min
             successful += 1
-            print(f"  ✓ Stored {rows} records")
+            log.debug("  ✓ Prepared %d days", len(cleaned_df))
+        
+        # Companies and prices are committed together in a single transaction
+        log.info("Storing company info...")
+        store_companies(db, companies)
+        
+        if frames:
+            # Compute analytics for every symbol in one grouped kernel call
+            log.info("Computing analytics...")
+            final_df = AnalyticsService.compute_all_metrics_grouped(
+                pd.concat(frames, ignore_index=True)
+            )
             
-            # Small delay to avoid rate limiting
-            time.sleep(0.5)
+            # Delta fetches: stored rows before the last stored date are unchanged
+            final_df = final_df[final_df["date"] >= final_df["symbol"].map(cutoffs)]
+            
+            # Store every symbol's prices with one upsert
+            log.info("Storing price data...")
+            total_rows = store_prices(db, final_df)
+            log.info("  ✓ Stored %d records", total_rows)
+        db.commit()
+    
+        # Materialize derived tables once all prices are stored
+        log.info("Materializing top movers...")
+        movers = store_top_movers(db)
+        log.info("  ✓ Stored %d top mover rows", movers)
+        
+        log.info("Materializing latest snapshots...")
+        snapshots = store_latest_snapshots(db)
+        log.info("  ✓ Stored %d symbol snapshots", snapshots)
     
     except KeyboardInterrupt:
-        print("\n\n⚠ Ingestion interrupted by user")
+        log.warning("⚠ Ingestion interrupted by user")
     
     finally:
         db.close()
     
     # Summary
-    print("\n" + "=" * 60)
-    print("Ingestion Complete")
-    print("=" * 60)
-    print(f"Successful: {successful}/{len(INDIAN_STOCKS)} stocks")
-    print(f"Failed: {failed}/{len(INDIAN_STOCKS)} stocks")
-    print(f"Total records: {total_rows}")
+    log.info("=" * 60)
+    log.info("Ingestion Complete")
+    log.info("=" * 60)
+    log.info("Successful: %d/%d stocks", successful, len(INDIAN_STOCKS))
+    log.info("Skipped (up to date): %d/%d stocks", skipped, len(INDIAN_STOCKS))
+    log.info("Failed: %d/%d stocks", failed, len(INDIAN_STOCKS))
+    log.info("Total records: %d", total_rows)
 
 
 if __name__ == "__main__":
+    # Step-level messages are DEBUG; pass -v to see them (for this script
+    # only, not the DEBUG chatter of yfinance and requests-cache)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if "-v" in sys.argv[1:]:
+        log.setLevel(logging.DEBUG)
     ingest_all_stocks()
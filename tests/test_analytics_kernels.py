@@ -0,0 +1,110 @@
+"""
+Reference tests for the fused analytics kernels.
+
+compute_all and compute_all_grouped must reproduce the pandas rolling/ewm
+formulations they replaced, including series shorter than each window.
+"""
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.config import MA_WINDOW_7, MA_WINDOW_20, VOLATILITY_WINDOW, RSI_WINDOW
+from app.services.analytics_kernels import compute_all, compute_all_grouped
+
+WINDOWS = (MA_WINDOW_7, MA_WINDOW_20, VOLATILITY_WINDOW, RSI_WINDOW)
+METRICS = ("daily_return", "ma_short", "ma_long", "volatility", "rsi")
+
+
+def _prices(n: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n)))
+    open_ = close * (1 + rng.normal(0, 0.01, n))
+    if n > 5:
+        open_[5] = 0.0  # daily_return is defined as 0 here
+    return open_, close
+
+
+def _reference(open_: np.ndarray, close: np.ndarray):
+    open_s = pd.Series(open_)
+    close_s = pd.Series(close)
+
+    daily_return = (close_s - open_s) / open_s
+    daily_return[open_s == 0] = 0.0
+
+    ma_short = close_s.rolling(MA_WINDOW_7, min_periods=MA_WINDOW_7).mean()
+    ma_long = close_s.rolling(MA_WINDOW_20, min_periods=MA_WINDOW_20).mean()
+    volatility = daily_return.rolling(
+        VOLATILITY_WINDOW, min_periods=VOLATILITY_WINDOW
+    ).std() * math.sqrt(252)
+
+    # Wilder smoothing seeded with the mean of the first RSI_WINDOW changes:
+    # ewm(adjust=False) started from that seed at position RSI_WINDOW
+    delta = close_s.diff()
+    gains = delta.clip(lower=0)
+    losses = (-delta).clip(lower=0)
+
+    def wilder(values: pd.Series) -> pd.Series:
+        out = pd.Series(np.nan, index=values.index)
+        if len(values) > RSI_WINDOW:
+            seeded = pd.concat([
+                pd.Series([values.iloc[1:RSI_WINDOW + 1].mean()]),
+                values.iloc[RSI_WINDOW + 1:],
+            ], ignore_index=True)
+            out.iloc[RSI_WINDOW:] = seeded.ewm(alpha=1 / RSI_WINDOW, adjust=False).mean().to_numpy()
+        return out
+
+    avg_gain = wilder(gains)
+    avg_loss = wilder(losses)
+    rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+    rsi[(avg_loss == 0) & (avg_gain > 0)] = 100.0
+    rsi[(avg_loss == 0) & (avg_gain == 0)] = np.nan
+
+    return tuple(
+        s.to_numpy(dtype=np.float64)
+        for s in (daily_return, ma_short, ma_long, volatility, rsi)
+    )
+
+
+def _assert_matches(actual, expected):
+    for name, a, e in zip(METRICS, actual, expected):
+        np.testing.assert_allclose(a, e, rtol=1e-9, atol=1e-12, equal_nan=True, err_msg=name)
+
+
+@pytest.mark.parametrize("n", [0, 1, 14, 20, 21, 300])
+def test_compute_all_matches_pandas_reference(n):
+    open_, close = _prices(n)
+    _assert_matches(compute_all(open_, close, *WINDOWS), _reference(open_, close))
+
+
+def test_compute_all_flat_series():
+    close = np.full(60, 250.0)
+    daily_return, ma_short, ma_long, volatility, rsi = compute_all(close.copy(), close, *WINDOWS)
+
+    assert (daily_return == 0).all()
+    np.testing.assert_array_equal(ma_short[MA_WINDOW_7 - 1:], 250.0)
+    np.testing.assert_array_equal(ma_long[MA_WINDOW_20 - 1:], 250.0)
+    np.testing.assert_array_equal(volatility[VOLATILITY_WINDOW - 1:], 0.0)
+    # No gains and no losses: RSI is undefined
+    assert np.isnan(rsi).all()
+    _assert_matches(
+        (daily_return, ma_short, ma_long, volatility, rsi),
+        _reference(close.copy(), close),
+    )
+
+
+def test_compute_all_grouped_restarts_windows_per_group():
+    lengths = [25, 1, 0, 300, 14, 21]
+    series = [_prices(n, seed=i) for i, n in enumerate(lengths)]
+    open_ = np.concatenate([o for o, _ in series])
+    close = np.concatenate([c for _, c in series])
+    starts = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+
+    grouped = compute_all_grouped(open_, close, starts, *WINDOWS)
+
+    assert grouped.shape == (5, len(close))
+    for g, (o, c) in enumerate(series):
+        lo, hi = starts[g], starts[g + 1]
+        _assert_matches(grouped[:, lo:hi], _reference(o, c))
+        np.testing.assert_array_equal(grouped[:, lo:hi], np.vstack(compute_all(o, c, *WINDOWS)))
@@ -0,0 +1,60 @@
+"""
+Boundary tests for the /analytics RSI and volatility labels.
+
+The bisect-based classifiers must agree with the original comparison
+chains, including at each threshold value.
+"""
+import pytest
+
+from app.api.routes import _rsi_trend, _volatility_level
+
+
+def _reference_rsi_trend(rsi: float) -> str:
+    if rsi > 70:
+        return "overbought"
+    elif rsi < 30:
+        return "oversold"
+    elif rsi > 50:
+        return "bullish"
+    return "bearish"
+
+
+def _reference_volatility_level(volatility: float) -> str:
+    if volatility > 0.4:
+        return "high"
+    elif volatility < 0.2:
+        return "low"
+    return "normal"
+
+
+@pytest.mark.parametrize("rsi, expected", [
+    (29.99, "oversold"),
+    (30.0, "bearish"),
+    (50.0, "bearish"),
+    (50.01, "bullish"),
+    (70.0, "bullish"),
+    (70.01, "overbought"),
+])
+def test_rsi_trend_boundaries(rsi, expected):
+    assert _rsi_trend(rsi) == expected
+    assert _reference_rsi_trend(rsi) == expected
+
+
+@pytest.mark.parametrize("volatility, expected", [
+    (0.19, "low"),
+    (0.2, "normal"),
+    (0.4, "normal"),
+    (0.41, "high"),
+])
+def test_volatility_level_boundaries(volatility, expected):
+    assert _volatility_level(volatility) == expected
+    assert _reference_volatility_level(volatility) == expected
+
+
+def test_labels_match_reference_across_range():
+    for i in range(0, 10001):
+        rsi = i / 100
+        assert _rsi_trend(rsi) == _reference_rsi_trend(rsi)
+    for i in range(0, 1001):
+        volatility = i / 1000
+        assert _volatility_level(volatility) == _reference_volatility_level(volatility)
@@ -0,0 +1,101 @@
+"""
+Tests for the one-time init_db migrations.
+
+A database written by an earlier version (ISO TEXT dates, the retired
+indexes, no unique key on (symbol, date)) must be brought up to the
+current schema once, with its rows preserved.
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import create_engine, inspect, select, text
+
+from app.db import database
+from app.db.models import DailyPrice
+
+LEGACY_SCHEMA = (
+    """
+    CREATE TABLE daily_prices (
+        id INTEGER NOT NULL,
+        symbol VARCHAR(20) NOT NULL,
+        date DATE NOT NULL,
+        open FLOAT NOT NULL,
+        high FLOAT NOT NULL,
+        low FLOAT NOT NULL,
+        close FLOAT NOT NULL,
+        volume BIGINT,
+        daily_return FLOAT,
+        ma_7 FLOAT,
+        ma_20 FLOAT,
+        volatility_20d FLOAT,
+        rsi_14 FLOAT,
+        created_at DATETIME,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX ix_daily_prices_date ON daily_prices (date)",
+    "CREATE INDEX ix_daily_prices_symbol ON daily_prices (symbol)",
+    "CREATE INDEX ix_daily_prices_symbol_date ON daily_prices (symbol, date)",
+    "CREATE INDEX ix_daily_prices_date_return ON daily_prices (date, daily_return)",
+)
+
+LEGACY_ROWS = [
+    ("TCS.NS", "2024-01-15", 0.01),
+    ("TCS.NS", "2024-01-16", None),
+    ("INFY.NS", "2024-01-15", -0.02),
+    ("INFY.NS", "2024-02-29", 0.0),
+]
+
+
+@pytest.fixture
+def legacy_engine(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as conn:
+        for ddl in LEGACY_SCHEMA:
+            conn.execute(text(ddl))
+        for i, (symbol, day, daily_return) in enumerate(LEGACY_ROWS, 1):
+            conn.execute(
+                text(
+                    "INSERT INTO daily_prices (id, symbol, date, open, high, low, close, daily_return) "
+                    "VALUES (:id, :symbol, :date, 100, 101, 99, 100.5, :daily_return)"
+                ),
+                {"id": i, "symbol": symbol, "date": day, "daily_return": daily_return},
+            )
+    monkeypatch.setattr(database, "engine", engine)
+    yield engine
+    engine.dispose()
+
+
+def test_init_db_migrates_legacy_database_once(legacy_engine):
+    database.init_db()
+    database.init_db()
+
+    with legacy_engine.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM daily_prices")).scalar() == len(LEGACY_ROWS)
+        assert conn.execute(text("SELECT DISTINCT typeof(date) FROM daily_prices")).scalars().all() == ["integer"]
+        assert conn.execute(text("SELECT count(*) FROM daily_prices WHERE daily_return IS NULL")).scalar() == 0
+        assert conn.exec_driver_sql("PRAGMA user_version").scalar() == len(database._MIGRATIONS)
+        stored = conn.execute(
+            select(DailyPrice.symbol, DailyPrice.date).order_by(DailyPrice.id)
+        ).all()
+
+    assert stored == [(symbol, date.fromisoformat(day)) for symbol, day, _ in LEGACY_ROWS]
+
+    indexes = {i["name"]: i for i in inspect(legacy_engine).get_indexes("daily_prices")}
+    assert any(i["unique"] and i["column_names"] == ["symbol", "date"] for i in indexes.values())
+    assert "ix_daily_prices_symbol_date" not in indexes
+    assert indexes["ix_daily_prices_date_return"]["column_names"] == [
+        "date", "daily_return", "symbol", "close",
+    ]
+
+
+def test_init_db_skips_applied_migrations(legacy_engine):
+    database.init_db()
+    with legacy_engine.begin() as conn:
+        # A TEXT date written after migrating is left alone: the steps do not rerun
+        conn.execute(text("UPDATE daily_prices SET date = '2024-01-15' WHERE id = 1"))
+
+    database.init_db()
+
+    with legacy_engine.connect() as conn:
+        assert conn.execute(text("SELECT typeof(date) FROM daily_prices WHERE id = 1")).scalar() == "text"
@@ -0,0 +1,86 @@
+"""
+Tests for cached_response: rendered-body caching, ETag/Cache-Control
+headers and conditional GETs answered with 304.
+"""
+import pytest
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.testclient import TestClient
+
+from app.api.cache import cached_response
+from app.config import HTTP_CACHE_MAX_AGE, HTTP_STALE_WHILE_REVALIDATE
+from app.services.cache import clear_cache
+
+calls = []
+
+app = FastAPI()
+
+
+@app.get("/items/{item_id}")
+@cached_response(ttl=60)
+async def get_item(item_id: str, scale: int = Query(default=1)):
+    calls.append((item_id, scale))
+    if item_id == "missing":
+        raise HTTPException(status_code=404, detail="Item not found")
+    return {"item_id": item_id, "value": 21 * scale}
+
+
+@pytest.fixture
+def client():
+    clear_cache()
+    calls.clear()
+    with TestClient(app) as client:
+        yield client
+    clear_cache()
+
+
+def test_response_carries_etag_and_cache_control(client):
+    response = client.get("/items/a")
+
+    assert response.status_code == 200
+    assert response.json() == {"item_id": "a", "value": 21}
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["etag"].startswith('W/"')
+    assert response.headers["cache-control"] == (
+        f"public, max-age={HTTP_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={HTTP_STALE_WHILE_REVALIDATE}"
+    )
+
+
+def test_matching_if_none_match_returns_empty_304(client):
+    etag = client.get("/items/a").headers["etag"]
+
+    response = client.get("/items/a", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert "cache-control" in response.headers
+
+    for header in (f'W/"other", {etag}', "*"):
+        assert client.get("/items/a", headers={"If-None-Match": header}).status_code == 304
+
+
+def test_mismatched_if_none_match_returns_200(client):
+    first = client.get("/items/a")
+
+    response = client.get("/items/a", headers={"If-None-Match": 'W/"stale"'})
+
+    assert response.status_code == 200
+    assert response.content == first.content
+    assert response.headers["etag"] == first.headers["etag"]
+
+
+def test_body_is_cached_per_parameters(client):
+    client.get("/items/a")
+    client.get("/items/a")
+    doubled = client.get("/items/a", params={"scale": 2})
+
+    assert calls == [("a", 1), ("a", 2)]
+    assert doubled.json() == {"item_id": "a", "value": 42}
+    assert doubled.headers["etag"] != client.get("/items/a").headers["etag"]
+
+
+def test_errors_are_not_cached(client):
+    assert client.get("/items/missing").status_code == 404
+    assert client.get("/items/missing").status_code == 404
+    assert calls == [("missing", 1), ("missing", 1)]
@@ -0,0 +1,110 @@
+"""
+Tests for the ON CONFLICT(symbol, date) price upsert used by ingestion.
+
+Re-running ingestion over the same dates must update rows in place,
+never duplicate them.
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.db.models import Base, DailyPrice
+from scripts.data_ingestion import store_prices
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _prices() -> pd.DataFrame:
+    days = [date(2024, 1, 15), date(2024, 1, 16), date(2024, 1, 17)]
+    rows = []
+    for symbol, base in (("TCS.NS", 3500.0), ("INFY.NS", 1600.0)):
+        for i, day in enumerate(days):
+            close = base + i
+            rows.append({
+                "symbol": symbol,
+                "date": day,
+                "open": close - 1,
+                "high": close + 2,
+                "low": close - 2,
+                "close": close,
+                "volume": 1000 + i,
+                "daily_return": 1 / (close - 1),
+                "ma_7": np.nan,
+                "ma_20": np.nan,
+                "volatility_20d": np.nan,
+                "rsi_14": 50.0 + i,
+            })
+    return pd.DataFrame(rows)
+
+
+def _stored(db: Session) -> pd.DataFrame:
+    rows = db.execute(
+        select(
+            DailyPrice.id,
+            DailyPrice.symbol,
+            DailyPrice.date,
+            DailyPrice.close,
+            DailyPrice.ma_7,
+            DailyPrice.rsi_14,
+            DailyPrice.created_at,
+        ).order_by(DailyPrice.symbol, DailyPrice.date)
+    ).all()
+    # NULL metrics read back as None; compare them as NaN
+    return pd.DataFrame(rows).astype({"ma_7": "float64"}).set_index(["symbol", "date"])
+
+
+def test_store_prices_is_idempotent(db):
+    df = _prices()
+
+    assert store_prices(db, df) == len(df)
+    db.commit()
+    first = _stored(db)
+    assert store_prices(db, df) == len(df)
+    db.commit()
+
+    assert db.scalar(select(func.count()).select_from(DailyPrice)) == len(df)
+    pd.testing.assert_frame_equal(_stored(db), first)
+
+
+def test_store_prices_updates_changed_values(db):
+    df = _prices()
+    store_prices(db, df)
+    db.commit()
+    before = _stored(db)
+
+    df.loc[0, "close"] = 3600.0
+    df.loc[0, "rsi_14"] = 71.5
+    df.loc[0, "ma_7"] = 3550.0
+    store_prices(db, df)
+    db.commit()
+    after = _stored(db)
+
+    assert len(after) == len(df)
+    key = ("TCS.NS", date(2024, 1, 15))
+    assert after.loc[key, "close"] == 3600.0
+    assert after.loc[key, "rsi_14"] == 71.5
+    assert after.loc[key, "ma_7"] == 3550.0
+    # Updated in place: same row id and original creation time
+    assert after.loc[key, "id"] == before.loc[key, "id"]
+    assert after.loc[key, "created_at"] == before.loc[key, "created_at"]
+    pd.testing.assert_frame_equal(after.drop(index=[key]), before.drop(index=[key]))
+
+
+def test_store_prices_empty_frame(db):
+    assert store_prices(db, _prices().iloc[:0]) == 0